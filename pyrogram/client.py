@@ -223,7 +223,7 @@ class Client(Methods):
             Global link preview options for the client.
 
         fetch_replies (``bool``, *optional*):
-            Pass True to automatically fetch replies for messages.
+            Pass True to automatically fetch replies for messages and the channel posts attached to story media areas.
             Defaults to True.
 
         fetch_topics (``bool``, *optional*):
@@ -654,7 +654,7 @@ class Client(Methods):
                 signed_in = await qr_login.wait()
 
                 if signed_in:
-                    log.info(f"Logged in successfully as {signed_in.full_name}")
+                    log.info("Logged in successfully as %s", signed_in.full_name)
                     return signed_in
             except asyncio.TimeoutError:
                 log.info("Recreating QR code.")
@@ -1525,7 +1525,7 @@ class Client(Methods):
         self._last_sync_time = msg_id / float(2**32)
         self._last_monotonic = time.monotonic()
         self._is_server_time_synced = True
-        log.info(f"Time synced: {utils.timestamp_to_datetime(self._last_sync_time)}")
+        log.info("Time synced: %s", utils.timestamp_to_datetime(self._last_sync_time))
 
     def guess_mime_type(self, filename: Union[str, BytesIO]) -> Optional[str]:
         if isinstance(filename, BytesIO):
@@ -1545,6 +1545,9 @@ class Cache:
     def __getitem__(self, key):
         return self.store.get(key, None)
 
+    def get(self, key, default=None):
+        return self.store.get(key, default)
+
     def __setitem__(self, key, value):
         if key in self.store:
             del self.store[key]
@@ -60,7 +60,7 @@ class GetStickers:
 
         return types.List(
             [
-                await types.Sticker._parse(self, doc, {type(a): a for a in doc.attributes})
+                await types.Sticker._parse(self, doc)
                 for doc in sticker_set.documents
             ]
         )
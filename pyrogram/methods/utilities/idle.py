@@ -72,7 +72,7 @@ async def idle():
     task = None
 
     def signal_handler(signum, __):
-        log.info(f"Stop signal received ({signals[signum]}). Exiting...")
+        log.info("Stop signal received (%s). Exiting...", signals[signum])
         task.cancel()
 
     for s in (SIGINT, SIGTERM, SIGABRT):
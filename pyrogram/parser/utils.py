@@ -17,19 +17,20 @@
 #  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
 
 import re
-from struct import unpack
 
 # SMP = Supplementary Multilingual Plane: https://en.wikipedia.org/wiki/Plane_(Unicode)#Overview
 SMP_RE = re.compile(r"[\U00010000-\U0010FFFF]")
 
 
+def _split_smp(match: "re.Match") -> str:
+    # Split SMP in two surrogates, the same pair UTF-16 would encode it as
+    code_point = ord(match.group()) - 0x10000
+    return chr(0xD800 + (code_point >> 10)) + chr(0xDC00 + (code_point & 0x3FF))
+
+
 def add_surrogates(text: str) -> str:
     # Replace each SMP code point with a surrogate pair
-    return SMP_RE.sub(
-        lambda match:  # Split SMP in two surrogates
-        "".join(chr(i) for i in unpack("<HH", match.group().encode("utf-16le"))),
-        text
-    )
+    return SMP_RE.sub(_split_smp, text)
 
 
 def remove_surrogates(text: str) -> str:
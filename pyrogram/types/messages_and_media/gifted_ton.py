@@ -83,13 +83,8 @@ class GiftedTon(Object):
             sticker=random.choice(
                 types.List(
                     [
-                        await types.Sticker._parse(
-                            client,
-                            doc,
-                            {
-                                type(i): i for i in doc.attributes
-                            }
-                        ) for doc in raw_stickers.documents
+                        await types.Sticker._parse(client, doc)
+                        for doc in raw_stickers.documents
                     ]
                 )
             )
@@ -52,6 +52,17 @@ class GiveawayPrizeStars(Object):
         sticker (:obj:`~pyrogram.types.Sticker`):
             A sticker to be shown in the message.
     """
+
+    __slots__ = (
+        "star_count",
+        "transaction_id",
+        "boosted_chat",
+        "giveaway_message_id",
+        "giveaway_message",
+        "is_unclaimed",
+        "sticker",
+    )
+
     def __init__(
         self,
         *,
@@ -103,17 +114,5 @@ class GiveawayPrizeStars(Object):
             boosted_chat=types.Chat._parse_chat(client, chats.get(utils.get_raw_peer_id(action.boost_peer))),
             giveaway_message_id=action.message_id,
             giveaway_message=parsed_message,
-            sticker=random.choice(
-                types.List(
-                    [
-                        await types.Sticker._parse(
-                            client,
-                            doc,
-                            {
-                                type(i): i for i in doc.attributes
-                            }
-                        ) for doc in raw_stickers.documents
-                    ]
-                )
-            )
+            sticker=await types.Sticker._parse(client, random.choice(raw_stickers.documents))
         )
@@ -23,6 +23,8 @@ from pyrogram import enums, raw, types, utils
 
 from ..object import Object
 
+_NO_ENTITIES = ()
+
 
 class InputChecklistTask(Object):
     """Describes a task in a checklist to be sent.
@@ -41,6 +43,13 @@ class InputChecklistTask(Object):
             List of special entities that appear in the checklist title.
     """
 
+    __slots__ = (
+        "id",
+        "text",
+        "parse_mode",
+        "entities",
+    )
+
     def __init__(
         self,
         *,
@@ -59,14 +68,24 @@ class InputChecklistTask(Object):
     async def write(
         self, client: "pyrogram.Client"
     ) -> "raw.types.TodoItem":
-        task_title, task_entities = (await utils.parse_text_entities(
+        # A None parse mode falls back to the client default, which still parses markup.
+        if not self.entities and (self.parse_mode or client.parse_mode) == enums.ParseMode.DISABLED:
+            return raw.types.TodoItem(
+                id=self.id,
+                title=raw.types.TextWithEntities(
+                    text=str(self.text or "").strip(),
+                    entities=_NO_ENTITIES
+                )
+            )
+
+        task_title = await utils.parse_text_entities(
             client, self.text, self.parse_mode, self.entities
-        )).values()
+        )
 
         return raw.types.TodoItem(
             id=self.id,
             title=raw.types.TextWithEntities(
-                text=task_title,
-                entities=task_entities or []
+                text=task_title["message"],
+                entities=task_title["entities"] or _NO_ENTITIES
             )
         )
@@ -47,6 +47,14 @@ class LinkPreviewOptions(Object):
             Otherwise, the link preview will be shown below the message text.
     """
 
+    __slots__ = (
+        "is_disabled",
+        "url",
+        "prefer_small_media",
+        "prefer_large_media",
+        "show_above_text",
+    )
+
     def __init__(
         self,
         *,
@@ -70,14 +78,17 @@ class LinkPreviewOptions(Object):
         url: str = None,
         invert_media: bool = None
     ) -> Optional["LinkPreviewOptions"]:
-        if isinstance(media, raw.types.MessageMediaWebPage) and not isinstance(media.webpage, raw.types.WebPageNotModified):
-            return LinkPreviewOptions(
-                is_disabled=False,
-                url=media.webpage.url,
-                prefer_small_media=media.force_small_media,
-                prefer_large_media=media.force_large_media,
-                show_above_text=invert_media,
-            )
+        if type(media) is raw.types.MessageMediaWebPage:
+            webpage = media.webpage
+
+            if type(webpage) is not raw.types.WebPageNotModified:
+                return LinkPreviewOptions(
+                    is_disabled=False,
+                    url=webpage.url,
+                    prefer_small_media=media.force_small_media,
+                    prefer_large_media=media.force_large_media,
+                    show_above_text=invert_media,
+                )
 
         if url:
             return LinkPreviewOptions(
@@ -48,6 +48,16 @@ class Location(Object):
             For live locations, a maximum distance to another chat member for proximity alerts, in meters (0-100000).
     """
 
+    __slots__ = (
+        "longitude",
+        "latitude",
+        "accuracy_radius",
+        "address",
+        "live_period",
+        "heading",
+        "proximity_alert_radius",
+    )
+
     def __init__(
         self,
         *,
@@ -70,8 +80,8 @@ class Location(Object):
         self.proximity_alert_radius = proximity_alert_radius
 
     @staticmethod
-    def _parse(geo_point: "raw.types.GeoPoint") -> Optional["Location"]:
-        if isinstance(geo_point, raw.types.GeoPoint):
+    def _parse(geo_point: "raw.base.GeoPoint") -> Optional["Location"]:
+        if type(geo_point) is raw.types.GeoPoint:
             return Location(
                 longitude=geo_point.long,
                 latitude=geo_point.lat,
@@ -79,31 +89,28 @@ class Location(Object):
             )
 
     @staticmethod
-    def _parse_business(location: "raw.types.BusinessLocation") -> "Location":
-        if isinstance(location, raw.types.BusinessLocation):
-            longitude = None
-            latitude = None
-            accuracy_radius = None
+    def _parse_business(location: Optional["raw.types.BusinessLocation"]) -> Optional["Location"]:
+        if location is None:
+            return None
 
-            if isinstance(location.geo_point, raw.types.GeoPoint):
-                longitude = location.geo_point.long
-                latitude = location.geo_point.lat
-                accuracy_radius = location.geo_point.accuracy_radius
+        geo_point = location.geo_point
 
+        if type(geo_point) is raw.types.GeoPoint:
             return Location(
-                longitude=longitude,
-                latitude=latitude,
-                accuracy_radius=accuracy_radius,
+                longitude=geo_point.long,
+                latitude=geo_point.lat,
+                accuracy_radius=geo_point.accuracy_radius,
                 address=location.address
             )
 
+        return Location(address=location.address)
+
     @staticmethod
     def _parse_media(media: "raw.types.MessageMediaGeoLive") -> Optional["Location"]:
-        if isinstance(media, raw.types.MessageMediaGeoLive):
-            parsed_location = Location._parse(media.geo)
+        parsed_location = Location._parse(media.geo)
 
-            parsed_location.live_period = media.period
-            parsed_location.heading = media.heading
-            parsed_location.proximity_alert_radius = media.proximity_notification_radius
+        parsed_location.live_period = media.period
+        parsed_location.heading = media.heading
+        parsed_location.proximity_alert_radius = media.proximity_notification_radius
 
-            return parsed_location
+        return parsed_location
@@ -40,6 +40,14 @@ class MaskPosition(Object):
         scale (``float``):
             Mask scaling coefficient. For example, 2.0 means double size.
     """
+
+    __slots__ = (
+        "point",
+        "x_shift",
+        "y_shift",
+        "scale",
+    )
+
     def __init__(
         self,
         *,
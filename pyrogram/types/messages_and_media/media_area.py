@@ -16,10 +16,11 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Optional, Union
+import asyncio
+from typing import Dict, List, Optional, Tuple, Union
 
 import pyrogram
-from pyrogram import enums, raw, types
+from pyrogram import enums, raw, types, utils
 from pyrogram.errors import ChannelInvalid, ChannelPrivate
 
 from ..object import Object
@@ -61,6 +62,7 @@ class MediaArea(Object):
         message (:obj:`~pyrogram.types.Message`, *optional*):
             Message attached to the story.
             Can be empty if the message was deleted or unavailable (channel is private).
+            Fetched automatically only if *fetch_replies* is enabled on the client, use :meth:`get_message` otherwise.
             For post type only.
 
         location (:obj:`~pyrogram.types.Location`, *optional*):
@@ -99,6 +101,30 @@ class MediaArea(Object):
             Information about this gift.
     """
 
+    __slots__ = (
+        "x",
+        "y",
+        "width",
+        "height",
+        "rotation",
+        "type",
+        "radius",
+        "sender_chat",
+        "message_id",
+        "message",
+        "location",
+        "reaction",
+        "is_dark",
+        "is_flipped",
+        "url",
+        "venue",
+        "emoji",
+        "temperature",
+        "color",
+        "gift",
+        "_channel_id",
+    )
+
     def __init__(
         self,
         *,
@@ -147,73 +173,74 @@ class MediaArea(Object):
         self.color = color
         self.gift = gift
 
+        self._channel_id = None
+
     @staticmethod
     async def _parse(
         client: "pyrogram.Client",
         area: "raw.base.MediaArea",
-        chats: dict = None
+        chats: dict = None,
+        messages: Dict[Tuple[int, int], "types.Message"] = None
     ) -> "MediaArea":
-        sender_chat = None
-        message_id = None
-        message = None
-        location = None
-        reaction = None
-        is_dark = None
-        is_flipped = None
-        url = None
-        venue = None
-        emoji = None
-        temperature = None
-        color = None
-        gift = None
-
-        if isinstance(area, raw.types.MediaAreaChannelPost):
-            sender_chat = types.Chat._parse_channel_chat(client, chats.get(area.channel_id))
-            message_id = area.msg_id
+        area_type = type(area)
+        parser = _AREA_PARSERS.get(area_type)
+        parsed = await parser(client, area, chats, messages) if parser else {}
+        coordinates = area.coordinates
+
+        media_area = MediaArea(
+            x=coordinates.x,
+            y=coordinates.y,
+            width=coordinates.w,
+            height=coordinates.h,
+            rotation=coordinates.rotation,
+            type=_AREA_TYPES[area_type],
+            radius=coordinates.radius,
+            client=client,
+            **parsed
+        )
 
-            try:
-                message = await client.get_messages(chat_id=sender_chat.id, message_ids=message_id)
-            except (ChannelPrivate, ChannelInvalid):
-                pass
-        elif isinstance(area, raw.types.MediaAreaGeoPoint):
-            location = types.Location._parse(area.geo)
-        elif isinstance(area, raw.types.MediaAreaSuggestedReaction):
-            reaction = types.Reaction._parse(client, area.reaction)
-            is_dark = getattr(area, "dark", None)
-            is_flipped = getattr(area, "flipped", None)
-        elif isinstance(area, raw.types.MediaAreaUrl):
-            url = area.url
-        elif isinstance(area, raw.types.MediaAreaVenue):
-            venue = types.Venue._parse(client, area)
-        elif isinstance(area, raw.types.MediaAreaWeather):
-            emoji = area.emoji
-            temperature = area.temperature_c
-            color = area.color
-        elif isinstance(area, raw.types.MediaAreaStarGift):
-            gift = await client.get_upgraded_gift(area.slug)
-
-        return MediaArea(
-            x=area.coordinates.x,
-            y=area.coordinates.y,
-            width=area.coordinates.w,
-            height=area.coordinates.h,
-            rotation=area.coordinates.rotation,
-            type=enums.MediaAreaType(type(area)),
-            radius=getattr(area.coordinates, "radius", None),
-            sender_chat=sender_chat,
-            message_id=message_id,
-            message=message,
-            location=location,
-            reaction=reaction,
-            is_dark=is_dark,
-            is_flipped=is_flipped,
-            url=url,
-            venue=venue,
-            emoji=emoji,
-            temperature=temperature,
-            color=color,
-            gift=gift,
-            client=client
+        if area_type is raw.types.MediaAreaChannelPost:
+            # Kept so the post can still be fetched when the channel is missing from chats
+            media_area._channel_id = area.channel_id
+
+        return media_area
+
+    @staticmethod
+    async def _parse_many(
+        client: "pyrogram.Client",
+        areas: List["raw.base.MediaArea"],
+        chats: dict = None
+    ) -> List["MediaArea"]:
+        message_ids = {}
+        other_areas = []
+
+        for area in areas:
+            if isinstance(area, raw.types.MediaAreaChannelPost):
+                if client.fetch_replies:
+                    message_ids.setdefault(area.channel_id, []).append(area.msg_id)
+            else:
+                other_areas.append(area)
+
+        # Channel posts and network-bound areas (e.g. gifts) are all fetched in a single round.
+        results = await asyncio.gather(
+            *(_get_channel_posts(client, channel_id, ids) for channel_id, ids in message_ids.items()),
+            *(MediaArea._parse(client, area, chats) for area in other_areas)
+        )
+
+        messages = {}
+
+        for posts in results[:len(message_ids)]:
+            messages.update(posts)
+
+        parsed_areas = iter(results[len(message_ids):])
+
+        return types.List(
+            [
+                await MediaArea._parse(client, area, chats, messages)
+                if isinstance(area, raw.types.MediaAreaChannelPost)
+                else next(parsed_areas)
+                for area in areas
+            ]
         )
 
     async def write(
@@ -228,7 +255,59 @@ class MediaArea(Object):
             "raw.types.MediaAreaStarGift"
         ]
     ]:
-        coordinates = raw.types.MediaAreaCoordinates(
+        writer = _AREA_WRITERS.get(self.type)
+
+        if writer is None:
+            return None
+
+        return await writer(self, client)
+
+    async def get_message(self) -> Optional["types.Message"]:
+        """Bound method *get_message* of :obj:`~pyrogram.types.MediaArea`.
+
+        Use as a shortcut for:
+
+        .. code-block:: python
+
+            await client.get_messages(
+                chat_id=media_area.sender_chat.id,
+                message_ids=media_area.message_id
+            )
+
+        The fetched message is stored in *message*, so it's requested only once.
+        For post type only.
+
+        Example:
+            .. code-block:: python
+
+                message = await media_area.get_message()
+
+        Returns:
+            :obj:`~pyrogram.types.Message` | ``None``: The message attached to the story, None in case it's unavailable.
+
+        Raises:
+            RPCError: In case of a Telegram RPC error.
+        """
+        if self.message is None and self.type == enums.MediaAreaType.POST:
+            if self._channel_id is not None:
+                chat_id = utils.get_channel_id(self._channel_id)
+            elif self.sender_chat:
+                chat_id = self.sender_chat.id
+            else:
+                return None
+
+            try:
+                self.message = await self._client.get_messages(
+                    chat_id=chat_id,
+                    message_ids=self.message_id
+                )
+            except (ChannelPrivate, ChannelInvalid):
+                pass
+
+        return self.message
+
+    def _write_coordinates(self) -> "raw.types.MediaAreaCoordinates":
+        return raw.types.MediaAreaCoordinates(
             x=self.x,
             y=self.y,
             w=self.width,
@@ -237,51 +316,197 @@ class MediaArea(Object):
             radius=self.radius
         )
 
-        if self.type == enums.MediaAreaType.POST:
-            return raw.types.InputMediaAreaChannelPost(
-                coordinates=coordinates,
-                channel=await client.resolve_peer(self.sender_chat.id),
-                msg_id=self.message_id
-            )
-        elif self.type == enums.MediaAreaType.LOCATION:
-            return raw.types.MediaAreaGeoPoint(
-                coordinates=coordinates,
-                geo=raw.types.InputGeoPoint(
-                    lat=self.location.latitude,
-                    long=self.location.longitude,
-                    accuracy_radius=self.location.accuracy_radius
-                )
-            )
-        elif self.type == enums.MediaAreaType.REACTION:
-            if self.reaction.custom_emoji_id:
-                reaction = raw.types.ReactionCustomEmoji(
-                    document_id=self.reaction.custom_emoji_id
-                )
-            else:
-                reaction = raw.types.ReactionEmoji(
-                    emoticon=self.reaction.emoji
-                )
 
-            return raw.types.MediaAreaSuggestedReaction(
-                coordinates=coordinates,
-                reaction=reaction,
-                dark=self.is_dark,
-                flipped=self.is_flipped
-            )
-        elif self.type == enums.MediaAreaType.URL:
-            return raw.types.MediaAreaUrl(
-                coordinates=coordinates,
-                url=self.url
-            )
-        elif self.type == enums.MediaAreaType.WEATHER:
-            return raw.types.MediaAreaWeather(
-                coordinates=coordinates,
-                emoji=self.emoji,
-                temperature_c=self.temperature,
-                color=self.color
-            )
-        elif self.type == enums.MediaAreaType.GIFT:
-            return raw.types.MediaAreaStarGift(
-                coordinates=coordinates,
-                slug=self.gift.name
-            )
+async def _parse_channel_post(
+    client: "pyrogram.Client",
+    area: "raw.types.MediaAreaChannelPost",
+    chats: dict,
+    messages: Optional[dict]
+) -> dict:
+    sender_chat = types.Chat._parse_channel_chat(client, chats.get(area.channel_id))
+    message = None
+
+    if messages is not None:
+        message = messages.get((area.channel_id, area.msg_id))
+    elif client.fetch_replies:
+        try:
+            message = await client.get_messages(chat_id=utils.get_channel_id(area.channel_id), message_ids=area.msg_id)
+        except (ChannelPrivate, ChannelInvalid):
+            pass
+
+    return dict(sender_chat=sender_chat, message_id=area.msg_id, message=message)
+
+
+async def _get_channel_posts(
+    client: "pyrogram.Client",
+    channel_id: int,
+    message_ids: List[int]
+) -> Dict[Tuple[int, int], "types.Message"]:
+    try:
+        messages = await client.get_messages(
+            chat_id=utils.get_channel_id(channel_id),
+            message_ids=message_ids
+        )
+    except (ChannelPrivate, ChannelInvalid):
+        return {}
+
+    return {(channel_id, message.id): message for message in messages}
+
+
+async def _parse_geo_point(
+    client: "pyrogram.Client",
+    area: "raw.types.MediaAreaGeoPoint",
+    chats: dict,
+    messages: Optional[dict]
+) -> dict:
+    return dict(location=types.Location._parse(area.geo))
+
+
+async def _parse_suggested_reaction(
+    client: "pyrogram.Client",
+    area: "raw.types.MediaAreaSuggestedReaction",
+    chats: dict,
+    messages: Optional[dict]
+) -> dict:
+    return dict(
+        reaction=types.Reaction._parse(client, area.reaction),
+        is_dark=getattr(area, "dark", None),
+        is_flipped=getattr(area, "flipped", None)
+    )
+
+
+async def _parse_url(
+    client: "pyrogram.Client",
+    area: "raw.types.MediaAreaUrl",
+    chats: dict,
+    messages: Optional[dict]
+) -> dict:
+    return dict(url=area.url)
+
+
+async def _parse_venue(
+    client: "pyrogram.Client",
+    area: "raw.types.MediaAreaVenue",
+    chats: dict,
+    messages: Optional[dict]
+) -> dict:
+    return dict(venue=types.Venue._parse(client, area))
+
+
+async def _parse_weather(
+    client: "pyrogram.Client",
+    area: "raw.types.MediaAreaWeather",
+    chats: dict,
+    messages: Optional[dict]
+) -> dict:
+    return dict(emoji=area.emoji, temperature=area.temperature_c, color=area.color)
+
+
+async def _parse_star_gift(
+    client: "pyrogram.Client",
+    area: "raw.types.MediaAreaStarGift",
+    chats: dict,
+    messages: Optional[dict]
+) -> dict:
+    return dict(gift=await client.get_upgraded_gift(area.slug))
+
+
+_AREA_PARSERS = {
+    raw.types.MediaAreaChannelPost: _parse_channel_post,
+    raw.types.MediaAreaGeoPoint: _parse_geo_point,
+    raw.types.MediaAreaSuggestedReaction: _parse_suggested_reaction,
+    raw.types.MediaAreaUrl: _parse_url,
+    raw.types.MediaAreaVenue: _parse_venue,
+    raw.types.MediaAreaWeather: _parse_weather,
+    raw.types.MediaAreaStarGift: _parse_star_gift,
+}
+
+_AREA_TYPES = {area_type.value: area_type for area_type in enums.MediaAreaType}
+
+
+async def _write_post(
+    area: "MediaArea",
+    client: "pyrogram.Client"
+) -> "raw.types.InputMediaAreaChannelPost":
+    return raw.types.InputMediaAreaChannelPost(
+        channel=await client.resolve_peer(area.sender_chat.id),
+        msg_id=area.message_id,
+        coordinates=area._write_coordinates()
+    )
+
+
+async def _write_location(
+    area: "MediaArea",
+    client: "pyrogram.Client"
+) -> "raw.types.MediaAreaGeoPoint":
+    return raw.types.MediaAreaGeoPoint(
+        geo=raw.types.InputGeoPoint(
+            lat=area.location.latitude,
+            long=area.location.longitude,
+            accuracy_radius=area.location.accuracy_radius
+        ),
+        coordinates=area._write_coordinates()
+    )
+
+
+async def _write_reaction(
+    area: "MediaArea",
+    client: "pyrogram.Client"
+) -> "raw.types.MediaAreaSuggestedReaction":
+    if area.reaction.custom_emoji_id:
+        reaction = raw.types.ReactionCustomEmoji(
+            document_id=area.reaction.custom_emoji_id
+        )
+    else:
+        reaction = raw.types.ReactionEmoji(
+            emoticon=area.reaction.emoji
+        )
+
+    return raw.types.MediaAreaSuggestedReaction(
+        reaction=reaction,
+        dark=area.is_dark,
+        flipped=area.is_flipped,
+        coordinates=area._write_coordinates()
+    )
+
+
+async def _write_url(
+    area: "MediaArea",
+    client: "pyrogram.Client"
+) -> "raw.types.MediaAreaUrl":
+    return raw.types.MediaAreaUrl(
+        url=area.url,
+        coordinates=area._write_coordinates()
+    )
+
+
+async def _write_weather(
+    area: "MediaArea",
+    client: "pyrogram.Client"
+) -> "raw.types.MediaAreaWeather":
+    return raw.types.MediaAreaWeather(
+        emoji=area.emoji,
+        temperature_c=area.temperature,
+        color=area.color,
+        coordinates=area._write_coordinates()
+    )
+
+
+async def _write_gift(
+    area: "MediaArea",
+    client: "pyrogram.Client"
+) -> "raw.types.MediaAreaStarGift":
+    return raw.types.MediaAreaStarGift(
+        slug=area.gift.name,
+        coordinates=area._write_coordinates()
+    )
+
+
+_AREA_WRITERS = {
+    enums.MediaAreaType.POST: _write_post,
+    enums.MediaAreaType.LOCATION: _write_location,
+    enums.MediaAreaType.REACTION: _write_reaction,
+    enums.MediaAreaType.URL: _write_url,
+    enums.MediaAreaType.WEATHER: _write_weather,
+    enums.MediaAreaType.GIFT: _write_gift,
+}
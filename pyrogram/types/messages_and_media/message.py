@@ -16,44 +16,85 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
 
+import asyncio
 import logging
 from datetime import datetime
-from functools import partial
+from functools import lru_cache
 from typing import BinaryIO, Callable, Dict, List, Match, Optional, Union
 
 import pyrogram
 from pyrogram import enums, raw, types, utils
-from pyrogram.errors import ChannelForumMissing, ChannelPrivate, ChannelInvalid, MessageIdsEmpty, PeerIdInvalid, ChatAdminRequired
-from pyrogram.parser import Parser
+from pyrogram.errors import ChannelForumMissing, ChannelPrivate, ChannelInvalid, MessageIdsEmpty, PeerIdInvalid, ChatAdminRequired, BadRequest
+from pyrogram.parser.html import HTML
+from pyrogram.parser.markdown import Markdown
 from pyrogram.parser import utils as parser_utils
 
 from ..object import Object
 from ..update import Update
+from .reply_parameters import ReplyParameters
 
 log = logging.getLogger(__name__)
 
+_PRIVATE_CHAT = enums.ChatType.PRIVATE
+
+
+@lru_cache(maxsize=None)
+def _warn_deprecated(message: str) -> None:
+    # Emits each deprecation notice only once per process
+    log.warning(message)
+
 
 class Str(str):
     def __init__(self, *args):
         super().__init__()
 
         self.entities: Optional[List["types.MessageEntity"]] = None
+        self._surrogates = None
 
     def init(self, entities: list):
         self.entities = entities
 
         return self
 
+    @property
+    def entities(self) -> Optional[List["types.MessageEntity"]]:
+        return self._entities
+
+    @entities.setter
+    def entities(self, entities: Optional[List["types.MessageEntity"]]):
+        self._entities = entities
+        self._markdown = None
+        self._html = None
+
     @property
     def markdown(self) -> str:
-        return Parser.unparse(self, self.entities, False)
+        if not self._entities:
+            return str(self)
+
+        if self._markdown is None:
+            self._markdown = Markdown.unparse(self, self._entities)
+
+        return self._markdown
 
     @property
     def html(self) -> str:
-        return Parser.unparse(self, self.entities, True)
+        if not self._entities:
+            return str(self)
+
+        if self._html is None:
+            self._html = HTML.unparse(self, self._entities)
+
+        return self._html
 
     def __getitem__(self, item) -> str:
-        return parser_utils.remove_surrogates(parser_utils.add_surrogates(self)[item])
+        if self._surrogates is None:
+            self._surrogates = parser_utils.add_surrogates(self)
+
+        # Without SMP characters UTF-16 offsets match the str ones, no re-encoding needed
+        if len(self._surrogates) == len(self):
+            return str.__getitem__(self, item)
+
+        return parser_utils.remove_surrogates(self._surrogates[item])
 
 
 class Message(Object, Update):
@@ -143,7 +184,7 @@ class Message(Object, Update):
         service (:obj:`~pyrogram.enums.MessageServiceType`, *optional*):
             The message is a service message.
             This field will contain the enumeration type of the service message.
-            You can use ``service = getattr(message, message.service.value)`` to access the service message.
+            You can use ``message.service_object`` to access the service message.
 
         media (:obj:`~pyrogram.enums.MessageMediaType`, *optional*):
             The message is a media message.
@@ -545,6 +586,157 @@ class Message(Object, Update):
         channel_post (``bool``, *optional*):
             True, if the message is a channel post.
     """
+
+    __slots__ = (
+        "id",
+        "from_user",
+        "sender_chat",
+        "sender_boost_count",
+        "sender_business_bot",
+        "date",
+        "chat",
+        "topic_message",
+        "automatic_forward",
+        "from_offline",
+        "show_caption_above_media",
+        "external_reply",
+        "quote",
+        "topic",
+        "forward_origin",
+        "message_thread_id",
+        "direct_messages_topic_id",
+        "effect_id",
+        "reply_to_message_id",
+        "reply_to_story_id",
+        "reply_to_story_user_id",
+        "reply_to_top_message_id",
+        "reply_to_message",
+        "reply_to_story",
+        "reply_to_checklist_task_id",
+        "mentioned",
+        "empty",
+        "service",
+        "scheduled",
+        "from_scheduled",
+        "media",
+        "paid_media",
+        "checklist",
+        "edit_date",
+        "edit_hidden",
+        "media_group_id",
+        "author_signature",
+        "is_paid_post",
+        "has_protected_content",
+        "has_media_spoiler",
+        "text",
+        "entities",
+        "caption_entities",
+        "audio",
+        "document",
+        "photo",
+        "sticker",
+        "animation",
+        "game",
+        "giveaway",
+        "giveaway_winners",
+        "giveaway_completed",
+        "invoice",
+        "story",
+        "video",
+        "video_processing_pending",
+        "voice",
+        "video_note",
+        "caption",
+        "contact",
+        "location",
+        "venue",
+        "web_page",
+        "link_preview_options",
+        "poll",
+        "dice",
+        "new_chat_members",
+        "left_chat_member",
+        "chat_join_type",
+        "new_chat_title",
+        "new_chat_photo",
+        "delete_chat_photo",
+        "group_chat_created",
+        "supergroup_chat_created",
+        "channel_chat_created",
+        "migrate_to_chat_id",
+        "migrate_from_chat_id",
+        "pinned_message",
+        "game_high_score",
+        "views",
+        "forwards",
+        "via_bot",
+        "outgoing",
+        "matches",
+        "command",
+        "giveaway_prize_stars",
+        "screenshot_taken",
+        "business_connection_id",
+        "reply_markup",
+        "forum_topic_created",
+        "forum_topic_closed",
+        "forum_topic_reopened",
+        "forum_topic_edited",
+        "general_forum_topic_hidden",
+        "general_forum_topic_unhidden",
+        "video_chat_scheduled",
+        "history_cleared",
+        "video_chat_started",
+        "video_chat_ended",
+        "video_chat_members_invited",
+        "phone_call_started",
+        "phone_call_ended",
+        "web_app_data",
+        "paid_messages_refunded",
+        "paid_messages_price_changed",
+        "direct_message_price_changed",
+        "checklist_tasks_done",
+        "checklist_tasks_added",
+        "gift_code",
+        "gifted_premium",
+        "gifted_stars",
+        "gifted_ton",
+        "gift",
+        "is_prepaid_upgrade",
+        "suggest_profile_photo",
+        "suggest_birthday",
+        "users_shared",
+        "chat_shared",
+        "successful_payment",
+        "refunded_payment",
+        "suggested_post_approval_failed",
+        "suggested_post_approved",
+        "suggested_post_declined",
+        "suggested_post_paid",
+        "suggested_post_refunded",
+        "giveaway_created",
+        "chat_set_theme",
+        "chat_set_background",
+        "set_message_auto_delete_time",
+        "chat_boost",
+        "write_access_allowed",
+        "connected_website",
+        "contact_registered",
+        "proximity_alert_triggered",
+        "reactions",
+        "send_paid_messages_stars",
+        "unread_media",
+        "silent",
+        "legacy",
+        "pinned",
+        "restriction_reason",
+        "fact_check",
+        "suggested_post_info",
+        "channel_post",
+        "raw",
+        # Handlers and filters are free to attach their own attributes to messages
+        "__dict__",
+    )
+
     def __init__(
         self,
         *,
@@ -858,6 +1050,7 @@ class Message(Object, Update):
         chats: Dict[int, "raw.base.Chat"],
         replies: int = 1,
         business_connection_id: str = None,
+        parsed_chats: Dict[int, "types.Chat"] = None
     ) -> "Message":
         from_id = utils.get_raw_peer_id(message.from_id)
         peer_id = utils.get_raw_peer_id(message.peer_id)
@@ -880,307 +1073,19 @@ class Message(Object, Update):
 
         from_user = types.User._parse(client, users.get(from_id or peer_id))
         sender_chat = types.Chat._parse(client, message, users, chats, is_chat=False) if not from_user else None
-        chat = types.Chat._parse(client, message, users, chats, is_chat=True)
+        chat = parsed_chats.get(utils.get_peer_id(message.peer_id)) if parsed_chats else None
+
+        if chat is None:
+            chat = types.Chat._parse(client, message, users, chats, is_chat=True)
 
         action = message.action
+        action_type = type(action)
+        parser = _SERVICE_PARSERS.get(action_type)
 
-        connected_website = None
-        write_access_allowed = None
-        chat_boost = None
-        supergroup_chat_created = None
-        channel_chat_created = None
-        migrate_from_chat_id = None
-        new_chat_members = None
-        chat_join_type = None
-        group_chat_created = None
-        delete_chat_photo = None
-        left_chat_member = None
-        new_chat_photo = None
-        new_chat_title = None
-        migrate_to_chat_id = None
-        contact_registered = None
-        text = None
-        proximity_alert_triggered = None
-        gift_code = None
-        gifted_premium = None
-        gifted_stars = None
-        gifted_ton = None
-        giveaway_created = None
-        giveaway_completed = None
-        video_chat_ended = None
-        video_chat_started = None
-        video_chat_scheduled = None
-        history_cleared = None
-        video_chat_members_invited = None
-        successful_payment = None
-        refunded_payment = None
-        suggested_post_approval_failed = None
-        suggested_post_declined = None
-        suggested_post_approved = None
-        suggested_post_paid = None
-        suggested_post_refunded = None
-        phone_call_ended = None
-        phone_call_started = None
-        giveaway_prize_stars = None
-        users_shared = None
-        chat_shared = None
-        screenshot_taken = None
-        # passport_data_send = None
-        # passport_data_received = None
-        chat_set_theme = None
-        chat_set_background = None
-        set_message_auto_delete_time = None
-        gift = None
-        is_prepaid_upgrade = None
-        suggest_profile_photo = None
-        suggest_birthday = None
-        forum_topic_created = None
-        forum_topic_edited = None
-        general_forum_topic_hidden = None
-        forum_topic_closed = None
-        general_forum_topic_unhidden = None
-        forum_topic_reopened = None
-        web_app_data = None
-        paid_messages_refunded = None
-        paid_messages_price_changed = None
-        direct_message_price_changed = None
-        checklist_tasks_done = None
-        checklist_tasks_added = None
-
-        service_type = enums.MessageServiceType.UNSUPPORTED
-
-        if isinstance(action, raw.types.MessageActionBotAllowed):
-            if getattr(action, "domain", None):
-                service_type = enums.MessageServiceType.CONNECTED_WEBSITE
-                connected_website = action.domain
-            else:
-                service_type = enums.MessageServiceType.WRITE_ACCESS_ALLOWED
-                write_access_allowed = types.WriteAccessAllowed._parse(action)
-        elif isinstance(action, raw.types.MessageActionBoostApply):
-            service_type = enums.MessageServiceType.CHAT_BOOST
-            chat_boost = action.boosts
-        elif isinstance(action, raw.types.MessageActionChannelCreate):
-            service_type = enums.MessageServiceType.CHANNEL_CHAT_CREATED
-
-            if chat.type == enums.ChatType.SUPERGROUP:
-                supergroup_chat_created = True
-                service_type = enums.MessageServiceType.SUPERGROUP_CHAT_CREATED
-            else:
-                channel_chat_created = True
-                service_type = enums.MessageServiceType.CHANNEL_CHAT_CREATED
-        elif isinstance(action, raw.types.MessageActionChannelMigrateFrom):
-            service_type = enums.MessageServiceType.MIGRATE_FROM_CHAT_ID
-            migrate_from_chat_id = -action.chat_id
-        elif isinstance(action, raw.types.MessageActionChatAddUser):
-            service_type = enums.MessageServiceType.NEW_CHAT_MEMBERS
-            new_chat_members = [types.User._parse(client, users[i]) for i in action.users]
-            chat_join_type = enums.ChatJoinType.BY_ADD
-        elif isinstance(action, raw.types.MessageActionChatCreate):
-            service_type = enums.MessageServiceType.GROUP_CHAT_CREATED
-            group_chat_created = True
-        elif isinstance(action, raw.types.MessageActionChatDeletePhoto):
-            service_type = enums.MessageServiceType.DELETE_CHAT_PHOTO
-            delete_chat_photo = True
-        elif isinstance(action, raw.types.MessageActionChatDeleteUser):
-            service_type = enums.MessageServiceType.LEFT_CHAT_MEMBER
-            left_chat_member = types.User._parse(client, users[action.user_id])
-        elif isinstance(action, raw.types.MessageActionChatEditPhoto):
-            service_type = enums.MessageServiceType.NEW_CHAT_PHOTO
-            new_chat_photo = types.Photo._parse(client, action.photo)
-        elif isinstance(action, raw.types.MessageActionChatEditTitle):
-            service_type = enums.MessageServiceType.NEW_CHAT_TITLE
-            new_chat_title = action.title
-        elif isinstance(action, raw.types.MessageActionChatJoinedByLink):
-            service_type = enums.MessageServiceType.NEW_CHAT_MEMBERS
-            new_chat_members = [types.User._parse(client, users[utils.get_raw_peer_id(message.from_id)])]
-            chat_join_type = enums.ChatJoinType.BY_LINK
-        elif isinstance(action, raw.types.MessageActionChatJoinedByRequest):
-            service_type = enums.MessageServiceType.NEW_CHAT_MEMBERS
-            new_chat_members = [types.User._parse(client, users[utils.get_raw_peer_id(message.from_id)])]
-            chat_join_type = enums.ChatJoinType.BY_REQUEST
-        elif isinstance(action, raw.types.MessageActionChatMigrateTo):
-            service_type = enums.MessageServiceType.MIGRATE_TO_CHAT_ID
-            migrate_to_chat_id = utils.get_channel_id(action.channel_id)
-        elif isinstance(action, raw.types.MessageActionContactSignUp):
-            service_type = enums.MessageServiceType.CONTACT_REGISTERED
-            contact_registered = types.ContactRegistered()
-        elif isinstance(action, raw.types.MessageActionCustomAction):
-            service_type = enums.MessageServiceType.CUSTOM_ACTION
-            text = action.message
-        # TODO: elif isinstance(action, raw.types.MessageActionEmpty):
-        elif isinstance(action, raw.types.MessageActionGeoProximityReached):
-            service_type = enums.MessageServiceType.PROXIMITY_ALERT_TRIGGERED
-            proximity_alert_triggered = types.ProximityAlertTriggered._parse(client, action, users, chats)
-        elif isinstance(action, raw.types.MessageActionGiftCode):
-            service_type = enums.MessageServiceType.GIFT_CODE
-            gift_code = types.GiftCode._parse(client, action, users, chats)
-        elif isinstance(action, raw.types.MessageActionGiftPremium):
-            service_type = enums.MessageServiceType.GIFTED_PREMIUM
-            gifted_premium = await types.GiftedPremium._parse(
-                client,
-                action,
-                gifter=users.get(from_id),
-                receiver=users.get(peer_id or from_id),
-                users=users
-            )
-        elif isinstance(action, raw.types.MessageActionGiftStars):
-            service_type = enums.MessageServiceType.GIFTED_STARS
-            gifted_stars = await types.GiftedStars._parse(
-                client,
-                action,
-                gifter=users.get(from_id),
-                receiver=users.get(peer_id or from_id)
-            )
-        elif isinstance(action, raw.types.MessageActionGiftTon):
-            service_type = enums.MessageServiceType.GIFTED_TON
-            gifted_ton = await types.GiftedTon._parse(
-                client,
-                action,
-                gifter=users.get(from_id),
-                receiver=users.get(peer_id or from_id)
-            )
-        elif isinstance(action, raw.types.MessageActionGiveawayLaunch):
-            service_type = enums.MessageServiceType.GIVEAWAY_CREATED
-            giveaway_created = types.GiveawayCreated._parse(client, action)
-        elif isinstance(action, raw.types.MessageActionGiveawayResults):
-            service_type = enums.MessageServiceType.GIVEAWAY_COMPLETED
-            giveaway_completed = await types.GiveawayCompleted._parse(
-                client,
-                action,
-                types.Chat._parse(client, message, users, chats, is_chat=True),
-                getattr(
-                    getattr(
-                        message,
-                        "reply_to",
-                        None
-                    ),
-                    "reply_to_msg_id",
-                    None
-                )
-            )
-        elif isinstance(action, raw.types.MessageActionGroupCall):
-            if action.duration:
-                service_type = enums.MessageServiceType.VIDEO_CHAT_ENDED
-                video_chat_ended = types.VideoChatEnded._parse(action)
-            else:
-                service_type = enums.MessageServiceType.VIDEO_CHAT_STARTED
-                video_chat_started = types.VideoChatStarted()
-        elif isinstance(action, raw.types.MessageActionGroupCallScheduled):
-            service_type = enums.MessageServiceType.VIDEO_CHAT_SCHEDULED
-            video_chat_scheduled = types.VideoChatScheduled._parse(action)
-        if isinstance(action, raw.types.MessageActionHistoryClear):
-            service_type = enums.MessageServiceType.HISTORY_CLEARED
-            history_cleared = types.HistoryCleared()
-        elif isinstance(action, raw.types.MessageActionInviteToGroupCall):
-            service_type = enums.MessageServiceType.VIDEO_CHAT_MEMBERS_INVITED
-            video_chat_members_invited = types.VideoChatMembersInvited._parse(client, action, users)
-        elif isinstance(action, (raw.types.MessageActionPaymentSent, raw.types.MessageActionPaymentSentMe)):
-            service_type = enums.MessageServiceType.SUCCESSFUL_PAYMENT
-            successful_payment = types.SuccessfulPayment._parse(action)
-        elif isinstance(action, raw.types.MessageActionPaymentRefunded):
-            service_type = enums.MessageServiceType.REFUNDED_PAYMENT
-            refunded_payment = types.RefundedPayment._parse(action)
-        elif isinstance(action, raw.types.MessageActionSuggestedPostApproval):
-            if action.balance_too_low:
-                service_type = enums.MessageServiceType.SUGGESTED_POST_APPROVAL_FAILED
-                suggested_post_approval_failed = await types.SuggestedPostApprovalFailed._parse(client, message)
-            elif action.rejected:
-                service_type = enums.MessageServiceType.SUGGESTED_POST_DECLINED
-                suggested_post_declined = await types.SuggestedPostDeclined._parse(client, message)
-            else:
-                service_type = enums.MessageServiceType.SUGGESTED_POST_APPROVED
-                suggested_post_approved = await types.SuggestedPostApproved._parse(client, message)
-        elif isinstance(action, raw.types.MessageActionSuggestedPostSuccess):
-            service_type = enums.MessageServiceType.SUGGESTED_POST_PAID
-            suggested_post_paid = await types.SuggestedPostPaid._parse(client, message)
-        elif isinstance(action, raw.types.MessageActionSuggestedPostRefund):
-            service_type = enums.MessageServiceType.SUGGESTED_POST_REFUNDED
-            suggested_post_refunded = await types.SuggestedPostRefunded._parse(client, message)
-        elif isinstance(action, raw.types.MessageActionPhoneCall):
-            if action.reason:
-                service_type = enums.MessageServiceType.PHONE_CALL_ENDED
-                phone_call_ended = types.PhoneCallEnded._parse(action)
-            else:
-                service_type = enums.MessageServiceType.PHONE_CALL_STARTED
-                phone_call_started = types.PhoneCallStarted._parse(action)
-        elif isinstance(action, raw.types.MessageActionPrizeStars):
-            service_type = enums.MessageServiceType.GIVEAWAY_PRIZE_STARS
-            giveaway_prize_stars = await types.GiveawayPrizeStars._parse(client, action, chats)
-        elif isinstance(action, (raw.types.MessageActionRequestedPeer, raw.types.MessageActionRequestedPeerSentMe)):
-            _requested_chat = types.ChatShared._parse(client, action, chats)
-
-            if _requested_chat is None:
-                service_type = enums.MessageServiceType.USERS_SHARED
-                users_shared = types.UsersShared._parse(client, action, users)
-            else:
-                service_type = enums.MessageServiceType.CHAT_SHARED
-                chat_shared = _requested_chat
-        elif isinstance(action, raw.types.MessageActionScreenshotTaken):
-            service_type = enums.MessageServiceType.SCREENSHOT_TAKEN
-            screenshot_taken = types.ScreenshotTaken()
-        # TODO: elif isinstance(action, raw.types.MessageActionSecureValuesSent):
-            # service_type = enums.MessageServiceType.PASSPORT_DATA_SEND
-            # passport_data_send = ...
-        # TODO: elif isinstance(action, raw.types.MessageActionSecureValuesSentMe):
-            # service_type = enums.MessageServiceType.PASSPORT_DATA_RECEIVED
-            # passport_data_received = ...
-        elif isinstance(action, raw.types.MessageActionSetChatTheme):
-            service_type = enums.MessageServiceType.CHAT_SET_THEME
-            chat_set_theme = await types.ChatTheme._parse(client, action.theme)
-        elif isinstance(action, raw.types.MessageActionSetChatWallPaper):
-            service_type = enums.MessageServiceType.CHAT_SET_BACKGROUND
-            chat_set_background = types.ChatBackground._parse(client, action.wallpaper, action.same, action.for_both)
-        elif isinstance(action, raw.types.MessageActionSetMessagesTTL):
-            service_type = enums.MessageServiceType.SET_MESSAGE_AUTO_DELETE_TIME
-            set_message_auto_delete_time = action.period
-        elif isinstance(action, (raw.types.MessageActionStarGift, raw.types.MessageActionStarGiftUnique)):
-            service_type = enums.MessageServiceType.GIFT
-            is_prepaid_upgrade=action.prepaid_upgrade
-            gift = await types.Gift._parse_action(client, message, users, chats)
-        elif isinstance(action, raw.types.MessageActionSuggestProfilePhoto):
-            service_type = enums.MessageServiceType.SUGGEST_PROFILE_PHOTO
-            suggest_profile_photo = types.Photo._parse(client, action.photo)
-        elif isinstance(action, raw.types.MessageActionSuggestBirthday):
-            service_type = enums.MessageServiceType.SUGGEST_BIRTHDAY
-            suggest_birthday = types.Birthday._parse(action.birthday)
-        elif isinstance(action, raw.types.MessageActionTopicCreate):
-            service_type = enums.MessageServiceType.FORUM_TOPIC_CREATED
-            forum_topic_created = types.ForumTopicCreated._parse(message)
-        elif isinstance(action, raw.types.MessageActionTopicEdit):
-            if action.hidden is True:
-                service_type = enums.MessageServiceType.GENERAL_FORUM_TOPIC_HIDDEN
-                general_forum_topic_hidden = types.GeneralForumTopicHidden()
-            elif action.hidden is False:
-                service_type = enums.MessageServiceType.GENERAL_FORUM_TOPIC_UNHIDDEN
-                general_forum_topic_unhidden = types.GeneralForumTopicUnhidden()
-            elif action.closed is True:
-                service_type = enums.MessageServiceType.FORUM_TOPIC_CLOSED
-                forum_topic_closed = types.ForumTopicClosed()
-            elif action.closed is False:
-                service_type = enums.MessageServiceType.FORUM_TOPIC_REOPENED
-                forum_topic_reopened = types.ForumTopicReopened()
-            else:
-                service_type = enums.MessageServiceType.FORUM_TOPIC_EDITED
-                forum_topic_edited = types.ForumTopicEdited._parse(action)
-        elif isinstance(action, (raw.types.MessageActionWebViewDataSent, raw.types.MessageActionWebViewDataSentMe)):
-            service_type = enums.MessageServiceType.WEB_APP_DATA
-            web_app_data = types.WebAppData._parse(action)
-        elif isinstance(action, raw.types.MessageActionPaidMessagesRefunded):
-            service_type = enums.MessageServiceType.PAID_MESSAGES_REFUNDED
-            paid_messages_refunded = types.PaidMessagesRefunded._parse(action)
-        elif isinstance(action, raw.types.MessageActionPaidMessagesPrice):
-            if chat.type == enums.ChatType.DIRECT:
-                service_type = enums.MessageServiceType.DIRECT_MESSAGE_PRICE_CHANGED
-                direct_message_price_changed = types.DirectMessagePriceChanged._parse(action)
-            else:
-                service_type = enums.MessageServiceType.PAID_MESSAGES_PRICE_CHANGED
-                paid_messages_price_changed = types.PaidMessagesPriceChanged._parse(action)
-        elif isinstance(action, raw.types.MessageActionTodoCompletions):
-            service_type = enums.MessageServiceType.CHECKLIST_TASKS_DONE
-            checklist_tasks_done = types.ChecklistTasksDone._parse(message)
-        elif isinstance(action, raw.types.MessageActionTodoAppendTasks):
-            service_type = enums.MessageServiceType.CHECKLIST_TASKS_ADDED
-            checklist_tasks_added = types.ChecklistTasksAdded._parse(client, message)
+        if parser:
+            parsed_action = await parser(client, message, users, chats, chat)
+        else:
+            parsed_action = {"service": enums.MessageServiceType.UNSUPPORTED}
 
         parsed_message = Message(
             id=message.id,
@@ -1188,74 +1093,14 @@ class Message(Object, Update):
             chat=chat,
             from_user=from_user,
             sender_chat=sender_chat,
-            service=service_type,
-            connected_website=connected_website,
-            write_access_allowed=write_access_allowed,
-            chat_boost=chat_boost,
-            supergroup_chat_created=supergroup_chat_created,
-            channel_chat_created=channel_chat_created,
-            migrate_from_chat_id=migrate_from_chat_id,
-            new_chat_members=new_chat_members,
-            chat_join_type=chat_join_type,
-            group_chat_created=group_chat_created,
-            delete_chat_photo=delete_chat_photo,
-            left_chat_member=left_chat_member,
-            new_chat_photo=new_chat_photo,
-            new_chat_title=new_chat_title,
-            migrate_to_chat_id=migrate_to_chat_id,
-            contact_registered=contact_registered,
-            text=text,
-            proximity_alert_triggered=proximity_alert_triggered,
-            gift_code=gift_code,
-            gifted_premium=gifted_premium,
-            gifted_stars=gifted_stars,
-            gifted_ton=gifted_ton,
-            giveaway_created=giveaway_created,
-            giveaway_completed=giveaway_completed,
-            video_chat_ended=video_chat_ended,
-            video_chat_started=video_chat_started,
-            video_chat_scheduled=video_chat_scheduled,
-            history_cleared=history_cleared,
-            video_chat_members_invited=video_chat_members_invited,
-            successful_payment=successful_payment,
-            refunded_payment=refunded_payment,
-            suggested_post_approval_failed=suggested_post_approval_failed,
-            suggested_post_declined=suggested_post_declined,
-            suggested_post_approved=suggested_post_approved,
-            suggested_post_paid=suggested_post_paid,
-            suggested_post_refunded=suggested_post_refunded,
-            suggest_birthday=suggest_birthday,
-            phone_call_ended=phone_call_ended,
-            phone_call_started=phone_call_started,
-            giveaway_prize_stars=giveaway_prize_stars,
-            users_shared=users_shared,
-            chat_shared=chat_shared,
-            screenshot_taken=screenshot_taken,
-            chat_set_theme=chat_set_theme,
-            chat_set_background=chat_set_background,
-            set_message_auto_delete_time=set_message_auto_delete_time,
-            gift=gift,
-            is_prepaid_upgrade=is_prepaid_upgrade,
-            suggest_profile_photo=suggest_profile_photo,
-            forum_topic_created=forum_topic_created,
-            forum_topic_edited=forum_topic_edited,
-            general_forum_topic_hidden=general_forum_topic_hidden,
-            forum_topic_closed=forum_topic_closed,
-            general_forum_topic_unhidden=general_forum_topic_unhidden,
-            forum_topic_reopened=forum_topic_reopened,
-            web_app_data=web_app_data,
-            paid_messages_refunded=paid_messages_refunded,
-            paid_messages_price_changed=paid_messages_price_changed,
-            direct_message_price_changed=direct_message_price_changed,
-            checklist_tasks_done=checklist_tasks_done,
-            checklist_tasks_added=checklist_tasks_added,
+            **parsed_action,
             reactions=types.MessageReactions._parse(client, message.reactions, users, chats),
             business_connection_id=business_connection_id,
             raw=message,
             client=client
         )
 
-        if isinstance(action, raw.types.MessageActionGameScore):
+        if action_type is raw.types.MessageActionGameScore:
             parsed_message.game_high_score = types.GameHighScore._parse_action(client, message, users)
             parsed_message.service = enums.MessageServiceType.GAME_HIGH_SCORE
 
@@ -1269,7 +1114,7 @@ class Message(Object, Update):
                     )
                 except (MessageIdsEmpty, ChannelPrivate):
                     pass
-        elif isinstance(action, raw.types.MessageActionPinMessage):
+        elif action_type is raw.types.MessageActionPinMessage:
             parsed_message.service = enums.MessageServiceType.PINNED_MESSAGE
 
             if client.fetch_replies:
@@ -1283,14 +1128,8 @@ class Message(Object, Update):
                 except (MessageIdsEmpty, ChannelPrivate):
                     pass
 
-        if message.reply_to and message.reply_to.forum_topic:
-            parsed_message.topic_message = True
-            if message.reply_to.reply_to_top_id:
-                parsed_message.message_thread_id = message.reply_to.reply_to_top_id
-            elif message.reply_to.reply_to_msg_id:
-                parsed_message.message_thread_id = message.reply_to.reply_to_msg_id
-            else:
-                parsed_message.message_thread_id = 1
+        if message.reply_to:
+            _apply_forum_topic(parsed_message, message.reply_to)
 
         client.message_cache[(parsed_message.chat.id, parsed_message.id)] = parsed_message
 
@@ -1306,7 +1145,8 @@ class Message(Object, Update):
         is_scheduled: bool = False,
         replies: int = 1,
         business_connection_id: str = None,
-        raw_reply_to_message: "raw.base.Message" = None
+        raw_reply_to_message: "raw.base.Message" = None,
+        parsed_chats: Dict[int, "types.Chat"] = None
     ) -> "Message":
         from_id = utils.get_raw_peer_id(message.from_id)
         peer_id = utils.get_raw_peer_id(message.peer_id)
@@ -1329,12 +1169,16 @@ class Message(Object, Update):
 
         from_user = types.User._parse(client, users.get(from_id or peer_id))
         sender_chat = types.Chat._parse(client, message, users, chats, is_chat=False) if not from_user else None
-        chat = types.Chat._parse(client, message, users, chats, is_chat=True)
+        chat = parsed_chats.get(utils.get_peer_id(message.peer_id)) if parsed_chats else None
+
+        if chat is None:
+            chat = types.Chat._parse(client, message, users, chats, is_chat=True)
 
+        parse_entity = types.MessageEntity._parse
         entities = types.List(
             filter(
-                lambda x: x is not None,
-                [types.MessageEntity._parse(client, entity, users) for entity in message.entities]
+                None,
+                (parse_entity(client, entity, users) for entity in message.entities)
             )
         )
 
@@ -1349,223 +1193,80 @@ class Message(Object, Update):
                 chats,
             )
 
-        photo = None
-        location = None
-        contact = None
-        venue = None
-        game = None
-        giveaway = None
-        giveaway_winners = None
-        invoice = None
-        story = None
-        audio = None
-        voice = None
-        animation = None
-        video = None
-        video_note = None
-        sticker = None
-        document = None
-        web_page = None
-        link_preview_options = None
-        poll = None
-        dice = None
-        paid_media = None
-        checklist = None
-
         media = message.media
-        media_type = None
-        has_media_spoiler = None
+        parsed_media = {}
 
         if media:
-            if isinstance(media, raw.types.MessageMediaPhoto):
-                photo = types.Photo._parse(client, media.photo, media.ttl_seconds)
-                media_type = enums.MessageMediaType.PHOTO
-                has_media_spoiler = media.spoiler
-            elif isinstance(media, raw.types.MessageMediaGeo):
-                location = types.Location._parse(media.geo)
-                media_type = enums.MessageMediaType.LOCATION
-            elif isinstance(media, raw.types.MessageMediaGeoLive):
-                location = types.Location._parse_media(media)
-                media_type = enums.MessageMediaType.LOCATION
-            elif isinstance(media, raw.types.MessageMediaContact):
-                contact = types.Contact._parse(client, media)
-                media_type = enums.MessageMediaType.CONTACT
-            elif isinstance(media, raw.types.MessageMediaVenue):
-                venue = types.Venue._parse(client, media)
-                media_type = enums.MessageMediaType.VENUE
-            elif isinstance(media, raw.types.MessageMediaGame):
-                game = types.Game._parse(client, media)
-                media_type = enums.MessageMediaType.GAME
-            elif isinstance(media, raw.types.MessageMediaGiveaway):
-                giveaway = types.Giveaway._parse(client, media, chats)
-                media_type = enums.MessageMediaType.GIVEAWAY
-            elif isinstance(media, raw.types.MessageMediaGiveawayResults):
-                giveaway_winners = await types.GiveawayWinners._parse(client, media, users, chats)
-                media_type = enums.MessageMediaType.GIVEAWAY_WINNERS
-            elif isinstance(media, raw.types.MessageMediaInvoice):
-                invoice = types.Invoice._parse(client, media)
-                media_type = enums.MessageMediaType.INVOICE
-            elif isinstance(media, raw.types.MessageMediaStory):
-                story = await types.Story._parse(client, media, media.peer, users, chats)
-                media_type = enums.MessageMediaType.STORY
-            elif isinstance(media, raw.types.MessageMediaDocument):
-                doc = media.document
-                has_media_spoiler = media.spoiler
-
-                if isinstance(doc, raw.types.Document):
-                    attributes = {type(i): i for i in doc.attributes}
-
-                    file_name = getattr(
-                        attributes.get(
-                            raw.types.DocumentAttributeFilename, None
-                        ), "file_name", None
-                    )
+            parser = _MEDIA_PARSERS.get(type(media))
 
-                    if raw.types.DocumentAttributeAnimated in attributes:
-                        video_attributes = attributes.get(raw.types.DocumentAttributeVideo, None)
-
-                        if video_attributes and video_attributes.round_message:
-                            video_note = types.VideoNote._parse(client, doc, video_attributes, media.ttl_seconds)
-                            media_type = enums.MessageMediaType.VIDEO_NOTE
-                        else:
-                            animation = types.Animation._parse(client, doc, video_attributes, file_name)
-                            media_type = enums.MessageMediaType.ANIMATION
-                    elif raw.types.DocumentAttributeSticker in attributes:
-                        sticker = await types.Sticker._parse(client, doc, attributes)
-                        media_type = enums.MessageMediaType.STICKER
-                    elif raw.types.DocumentAttributeVideo in attributes:
-                        video_attributes = attributes[raw.types.DocumentAttributeVideo]
-
-                        if video_attributes.round_message:
-                            video_note = types.VideoNote._parse(client, doc, video_attributes, media.ttl_seconds)
-                            media_type = enums.MessageMediaType.VIDEO_NOTE
-                        else:
-                            video = types.Video._parse(client, doc, video_attributes, file_name, media.ttl_seconds, media.video_cover, media.video_timestamp, media.alt_documents)
-                            media_type = enums.MessageMediaType.VIDEO
-                    elif raw.types.DocumentAttributeAudio in attributes:
-                        audio_attributes = attributes[raw.types.DocumentAttributeAudio]
-
-                        if audio_attributes.voice:
-                            voice = types.Voice._parse(client, doc, audio_attributes, media.ttl_seconds)
-                            media_type = enums.MessageMediaType.VOICE
-                        else:
-                            audio = types.Audio._parse(client, doc, audio_attributes, file_name)
-                            media_type = enums.MessageMediaType.AUDIO
-                    else:
-                        document = types.Document._parse(client, doc, file_name)
-                        media_type = enums.MessageMediaType.DOCUMENT
-            elif isinstance(media, raw.types.MessageMediaWebPage):
-                media_type = enums.MessageMediaType.WEB_PAGE
-                web_page = types.WebPage._parse(client, media)
-            elif isinstance(media, raw.types.MessageMediaPoll):
-                poll = types.Poll._parse(client, media)
-                media_type = enums.MessageMediaType.POLL
-            elif isinstance(media, raw.types.MessageMediaDice):
-                dice = types.Dice._parse(client, media)
-                media_type = enums.MessageMediaType.DICE
-            elif isinstance(media, raw.types.MessageMediaPaidMedia):
-                paid_media = types.PaidMediaInfo._parse(client, media)
-                media_type = enums.MessageMediaType.PAID_MEDIA
-            elif isinstance(media, raw.types.MessageMediaToDo):
-                media_type = enums.MessageMediaType.CHECKLIST
-                checklist = types.Checklist._parse(client, media, users)
+            if parser:
+                parsed_media = await parser(client, media, users, chats)
             else:
-                media_type = enums.MessageMediaType.UNSUPPORTED
+                parsed_media = {"media": enums.MessageMediaType.UNSUPPORTED}
                 media = None
 
+        web_page = parsed_media.get("web_page")
+
         link_preview_options = types.LinkPreviewOptions._parse(
             media,
-            getattr(getattr(media, "webpage", None), "url", utils.get_first_url(message.message)),
+            getattr(getattr(media, "webpage", None), "url", None) or utils.get_first_url(message.message),
             message.invert_media
         )
 
         reply_markup = message.reply_markup
 
         if reply_markup:
-            if isinstance(reply_markup, raw.types.ReplyKeyboardForceReply):
-                reply_markup = types.ForceReply.read(reply_markup)
-            elif isinstance(reply_markup, raw.types.ReplyKeyboardMarkup):
-                reply_markup = types.ReplyKeyboardMarkup.read(reply_markup)
-            elif isinstance(reply_markup, raw.types.ReplyInlineMarkup):
-                reply_markup = types.InlineKeyboardMarkup.read(reply_markup)
-            elif isinstance(reply_markup, raw.types.ReplyKeyboardHide):
-                reply_markup = types.ReplyKeyboardRemove.read(reply_markup)
-            else:
-                reply_markup = None
+            reader = _REPLY_MARKUP_READERS.get(type(reply_markup))
+            reply_markup = reader(reply_markup) if reader else None
 
         reactions = types.MessageReactions._parse(client, message.reactions, users, chats)
 
+        restriction_reason = None
+
+        if message.restriction_reason:
+            restriction_reason = types.List(
+                types.RestrictionReason._parse(reason)
+                for reason in message.restriction_reason
+            )
+
+        # The message body is the text unless it comes with media other than a web page preview
+        is_text = media is None or web_page is not None
+        body = Str(message.message).init(entities) or None
+
         parsed_message = Message(
             id=message.id,
-            effect_id=getattr(message, "effect", None),
+            effect_id=message.effect,
             date=utils.timestamp_to_datetime(message.date),
             chat=chat,
             from_user=from_user,
             sender_chat=sender_chat,
-            sender_business_bot=types.User._parse(
-                client,
-                users.get(getattr(message, "via_business_bot_id", None))
-            ),
-            text=(
-                Str(message.message).init(entities) or None
-                if media is None or web_page is not None
-                else None
-            ),
-            caption=(
-                Str(message.message).init(entities) or None
-                if media is not None and web_page is None
-                else None
-            ),
-            entities=(
-                entities or None
-                if media is None or web_page is not None
-                else None
-            ),
-            caption_entities=(
-                entities or None
-                if media is not None and web_page is None
+            sender_business_bot=(
+                types.User._parse(client, users.get(message.via_business_bot_id))
+                if message.via_business_bot_id
                 else None
             ),
+            text=body if is_text else None,
+            caption=None if is_text else body,
+            entities=(entities or None) if is_text else None,
+            caption_entities=None if is_text else (entities or None),
             author_signature=message.post_author,
             is_paid_post=bool(getattr(message.suggested_post, "price", None)),
             has_protected_content=message.noforwards,
-            has_media_spoiler=has_media_spoiler,
             forward_origin=forward_origin,
             mentioned=message.mentioned,
             scheduled=is_scheduled,
             from_scheduled=message.from_scheduled,
-            media=media_type,
-            paid_media=paid_media,
-            checklist=checklist,
+            **parsed_media,
             show_caption_above_media=message.invert_media,
             edit_date=utils.timestamp_to_datetime(message.edit_date),
             edit_hidden=message.edit_hide,
             media_group_id=message.grouped_id,
-            photo=photo,
-            location=location,
-            contact=contact,
-            venue=venue,
-            audio=audio,
-            voice=voice,
-            animation=animation,
-            game=game,
-            giveaway=giveaway,
-            giveaway_winners=giveaway_winners,
-            invoice=invoice,
-            story=story,
-            video=video,
             video_processing_pending=message.video_processing_pending,
-            video_note=video_note,
-            sticker=sticker,
-            document=document,
-            web_page=web_page,
             link_preview_options=link_preview_options,
-            poll=poll,
-            dice=dice,
             views=message.views,
             forwards=message.forwards,
             sender_boost_count=message.from_boosts_applied,
-            via_bot=types.User._parse(client, users.get(message.via_bot_id)),
+            via_bot=types.User._parse(client, users.get(message.via_bot_id)) if message.via_bot_id else None,
             outgoing=message.out,
             business_connection_id=business_connection_id,
             reply_markup=reply_markup,
@@ -1575,10 +1276,7 @@ class Message(Object, Update):
             unread_media=message.media_unread,
             silent=message.silent,
             pinned=message.pinned,
-            restriction_reason=types.List(
-                types.RestrictionReason._parse(reason)
-                for reason in getattr(message, "restriction_reason", [])
-            ) or None,
+            restriction_reason=restriction_reason,
             fact_check=types.FactCheck._parse(client, message.factcheck, users),
             suggested_post_info=types.SuggestedPostInfo._parse(message.suggested_post),
             channel_post=message.post,
@@ -1612,15 +1310,7 @@ class Message(Object, Update):
                 parsed_message.reply_to_top_message_id = message.reply_to.reply_to_top_id
                 parsed_message.reply_to_checklist_task_id = message.reply_to.todo_item_id
 
-                if message.reply_to.forum_topic:
-                    parsed_message.topic_message = True
-
-                    if message.reply_to.reply_to_top_id:
-                        parsed_message.message_thread_id = message.reply_to.reply_to_top_id
-                    elif message.reply_to.reply_to_msg_id:
-                        parsed_message.message_thread_id = message.reply_to.reply_to_msg_id
-                    else:
-                        parsed_message.message_thread_id = 1
+                _apply_forum_topic(parsed_message, message.reply_to)
 
                 if message.reply_to.quote:
                     parsed_message.quote = types.TextQuote._parse(
@@ -1647,27 +1337,12 @@ class Message(Object, Update):
                     business_connection_id=business_connection_id,
                     replies=0
                 )
-            elif replies:
-                if isinstance(message.reply_to, raw.types.MessageReplyHeader):
-                    if message.reply_to.reply_to_peer_id:
-                        key = (utils.get_peer_id(message.reply_to.reply_to_peer_id), message.reply_to.reply_to_msg_id)
-                        reply_to_params = {"chat_id": key[0], 'message_ids': key[1]}
-                    else:
-                        key = (parsed_message.chat.id, parsed_message.reply_to_message_id)
-                        reply_to_params = {'chat_id': key[0], 'message_ids': message.id, 'reply': True}
-
-                    reply_to_message = client.message_cache[key]
-
-                    if not reply_to_message and client.fetch_replies:
-                        try:
-                            reply_to_message = await client.get_messages(
-                                replies=replies - 1,
-                                **reply_to_params
-                            )
-                        except (ChannelPrivate, ChannelInvalid, MessageIdsEmpty):
-                            pass
-
-                    parsed_message.reply_to_message = reply_to_message
+            elif replies and isinstance(message.reply_to, raw.types.MessageReplyHeader):
+                parsed_message.reply_to_message = await parsed_message._fetch_reply_to_message(
+                    message.reply_to.reply_to_peer_id,
+                    replies=replies - 1,
+                    fetch=client.fetch_replies
+                )
 
         if topics:
             parsed_message.topic = types.ForumTopic._parse(
@@ -1679,7 +1354,7 @@ class Message(Object, Update):
                 client.topic_cache[(parsed_message.chat.id, parsed_message.topic.id)] = parsed_message.topic
 
         if not parsed_message.topic and parsed_message.chat.is_forum:
-            parsed_topic = client.topic_cache[(parsed_message.chat.id, parsed_message.message_thread_id)]
+            parsed_topic = client.topic_cache.get((parsed_message.chat.id, parsed_message.message_thread_id))
 
             if parsed_topic:
                 parsed_message.topic = parsed_topic
@@ -1698,7 +1373,7 @@ class Message(Object, Update):
         if chat.type == enums.ChatType.DIRECT:
             parsed_message.direct_messages_topic_id = message.saved_peer_id.user_id
 
-            parsed_topic = client.topic_cache[(parsed_message.chat.id, parsed_message.direct_messages_topic_id)]
+            parsed_topic = client.topic_cache.get((parsed_message.chat.id, parsed_message.direct_messages_topic_id))
 
             if parsed_topic:
                 parsed_message.topic = parsed_topic
@@ -1729,39 +1404,113 @@ class Message(Object, Update):
         is_scheduled: bool = False,
         replies: int = 1,
         business_connection_id: Optional[str] = None,
-        raw_reply_to_message: Optional["raw.base.Message"] = None
+        raw_reply_to_message: Optional["raw.base.Message"] = None,
+        parsed_chats: Optional[Dict[int, "types.Chat"]] = None
     ) -> "Message":
-        if isinstance(message, raw.types.MessageEmpty):
-            return Message(
-                id=message.id,
-                empty=True,
-                business_connection_id=business_connection_id,
-                raw=message,
-                client=client,
-            )
+        # Regular messages are by far the most common, so check for them first
+        message_type = type(message)
 
-        if isinstance(message, raw.types.MessageService):
-            return await types.Message._parse_service(
+        if message_type is raw.types.Message:
+            return await types.Message._parse_message(
                 client=client,
                 message=message,
                 users=users,
                 chats=chats,
+                topics=topics,
+                is_scheduled=is_scheduled,
                 replies=replies,
-                business_connection_id=business_connection_id
+                business_connection_id=business_connection_id,
+                raw_reply_to_message=raw_reply_to_message,
+                parsed_chats=parsed_chats
             )
 
-        if isinstance(message, raw.types.Message):
-            return await types.Message._parse_message(
+        if message_type is raw.types.MessageService:
+            return await types.Message._parse_service(
                 client=client,
                 message=message,
                 users=users,
                 chats=chats,
-                topics=topics,
-                is_scheduled=is_scheduled,
                 replies=replies,
                 business_connection_id=business_connection_id,
-                raw_reply_to_message=raw_reply_to_message
+                parsed_chats=parsed_chats
+            )
+
+        if message_type is raw.types.MessageEmpty:
+            return Message(
+                id=message.id,
+                empty=True,
+                business_connection_id=business_connection_id,
+                raw=message,
+                client=client,
+            )
+
+    @staticmethod
+    async def _parse_many(
+        client: "pyrogram.Client",
+        messages: List["raw.base.Message"],
+        users: Dict[int, "raw.base.User"],
+        chats: Dict[int, "raw.base.Chat"],
+        topics: Optional[Dict[int, "raw.base.ForumTopic"]] = None,
+        replies: int = 1
+    ) -> List["Message"]:
+        # Fetch the users messages refer to but the batch lacks in bulk
+        # instead of letting each message fetch its own
+        missing_user_ids = set()
+        action_user_ids = set()
+
+        for message in messages:
+            if isinstance(message, raw.types.MessageEmpty):
+                continue
+
+            if isinstance(message.from_id, raw.types.PeerUser) and isinstance(message.peer_id, raw.types.PeerUser):
+                missing_user_ids.update((message.from_id.user_id, message.peer_id.user_id))
+
+            get_user_ids = _SERVICE_USER_IDS.get(type(getattr(message, "action", None)))
+
+            if get_user_ids:
+                action_user_ids.update(get_user_ids(message.action))
+
+        missing_user_ids.difference_update(users)
+        action_user_ids.difference_update(users, missing_user_ids)
+
+        # Users mentioned by service actions go in a request of their own,
+        # so a failure there can't cost the senders of private messages
+        await asyncio.gather(
+            *(
+                _fetch_users(client, user_ids, users)
+                for user_ids in (missing_user_ids, action_user_ids)
+                if user_ids
             )
+        )
+
+        # Messages of a batch usually share a handful of chats, parse each of them only once
+        parsed_chats = {}
+
+        for message in messages:
+            peer = getattr(message, "peer_id", None)
+
+            if peer is None:
+                continue
+
+            peer_id = utils.get_peer_id(peer)
+
+            if peer_id not in parsed_chats:
+                parsed_chats[peer_id] = types.Chat._parse_dialog(client, peer, users, chats)
+
+        return types.List(
+            [
+                await Message._parse(
+                    client=client,
+                    message=message,
+                    users=users,
+                    chats=chats,
+                    topics=topics,
+                    replies=replies,
+                    parsed_chats=parsed_chats
+                )
+                for message in messages
+            ]
+        )
 
     @property
     def link(self) -> str:
@@ -1769,40 +1518,49 @@ class Message(Object, Update):
             return ""
 
         if self.chat.username:
-            if self.message_thread_id:
-                return f"https://t.me/{self.chat.username}/{self.message_thread_id}/{self.id}"
-            else:
-                return f"https://t.me/{self.chat.username}/{self.id}"
+            base = f"https://t.me/{self.chat.username}"
         else:
-            if self.message_thread_id:
-                return f"https://t.me/c/{utils.get_channel_id(self.chat.id)}/{self.message_thread_id}/{self.id}"
-            else:
-                return f"https://t.me/c/{utils.get_channel_id(self.chat.id)}/{self.id}"
+            base = f"https://t.me/c/{utils.get_channel_id(self.chat.id)}"
+
+        if self.message_thread_id:
+            return f"{base}/{self.message_thread_id}/{self.id}"
+
+        return f"{base}/{self.id}"
 
     @property
     def content(self) -> Str:
         return self.text or self.caption or Str("").init([])
 
+    @property
+    def service_object(self):
+        if not self.service:
+            return None
+
+        if self.service == enums.MessageServiceType.CUSTOM_ACTION:
+            return self.text
+
+        return getattr(self, self.service.value, None)
+
     # region Deprecated
     # TODO: Remove later
 
     @property
     def forward_from(self) -> Optional["types.User"]:
-        log.warning(
+        _warn_deprecated(
             "`message.forward_from` is deprecated and will be removed in future updates. Use `message.forward_origin.sender_user` instead."
         )
         return getattr(self.forward_origin, "sender_user", None)
 
     @property
     def forward_sender_name(self) -> Optional[str]:
-        log.warning(
+        _warn_deprecated(
             "`message.forward_sender_name` property is deprecated and will be removed in future updates. Use `message.forward_origin.sender_user_name` instead."
         )
         return getattr(self.forward_origin, "sender_user_name", None)
 
     @property
     def forward_from_chat(self) -> Optional["types.Chat"]:
-        log.warning(
+        _warn_deprecated(
             "`message.forward_from_chat` property is deprecated and will be removed in future updates. Use `message.forward_origin.chat.sender_chat` instead."
         )
         return getattr(
@@ -1817,21 +1575,21 @@ class Message(Object, Update):
 
     @property
     def forward_from_message_id(self) -> Optional[int]:
-        log.warning(
+        _warn_deprecated(
             "`message.forward_from_message_id` property is deprecated and will be removed in future updates. Use `message.forward_origin.message_id` instead."
         )
         return getattr(self.forward_origin, "message_id", None)
 
     @property
     def forward_signature(self) -> Optional[str]:
-        log.warning(
+        _warn_deprecated(
             "`message.forward_signature` property is deprecated and will be removed in future updates. Use `message.forward_origin.author_signature` instead."
         )
         return getattr(self.forward_origin, "author_signature", None)
 
     @property
     def forward_date(self) -> Optional[datetime]:
-        log.warning(
+        _warn_deprecated(
             "`message.forward_date` property is deprecated and will be removed in future updates. Use `message.forward_origin.date` instead."
         )
         return getattr(self.forward_origin, "date", None)
@@ -1866,6 +1624,99 @@ class Message(Object, Update):
             message_id=self.id
         )
 
+    async def get_reply_to_message(self) -> Optional["types.Message"]:
+        """Bound method *get_reply_to_message* of :obj:`~pyrogram.types.Message`.
+
+        Use as a shortcut for:
+
+        .. code-block:: python
+
+            await client.get_messages(
+                chat_id=message.chat.id,
+                message_ids=message.id,
+                reply=True
+            )
+
+        Useful when *fetch_replies* is disabled on the client, the message is fetched only once and
+        stored in *reply_to_message*.
+
+        Example:
+            .. code-block:: python
+
+                reply_to_message = await message.get_reply_to_message()
+
+        Returns:
+            :obj:`~pyrogram.types.Message` | ``None``: The message this message replied to, None in case this
+            message isn't a reply or the replied message is unavailable.
+
+        Raises:
+            RPCError: In case of a Telegram RPC error.
+        """
+        if self.reply_to_message is not None or not self.reply_to_message_id:
+            return self.reply_to_message
+
+        self.reply_to_message = await self._fetch_reply_to_message(
+            getattr(getattr(self.raw, "reply_to", None), "reply_to_peer_id", None),
+            replies=0
+        )
+
+        return self.reply_to_message
+
+    async def _fetch_reply_to_message(
+        self,
+        reply_to_peer_id: Optional["raw.base.Peer"],
+        replies: int,
+        fetch: bool = True
+    ) -> Optional["types.Message"]:
+        # Looks the replied message up in the cache first and requests it only on a miss
+        if reply_to_peer_id:
+            key = (utils.get_peer_id(reply_to_peer_id), self.reply_to_message_id)
+        else:
+            key = (self.chat.id, self.reply_to_message_id)
+
+        reply_to_message = self._client.message_cache.get(key)
+
+        if not reply_to_message and fetch:
+            if reply_to_peer_id:
+                reply_to_params = {"chat_id": key[0], "message_ids": key[1]}
+            else:
+                reply_to_params = {"chat_id": key[0], "message_ids": self.id, "reply": True}
+
+            try:
+                reply_to_message = await self._client.get_messages(replies=replies, **reply_to_params)
+            except (ChannelPrivate, ChannelInvalid, MessageIdsEmpty):
+                pass
+
+        return reply_to_message
+
+    def _resolve_reply_defaults(
+        self,
+        quote: Optional[bool],
+        reply_parameters: Optional["types.ReplyParameters"],
+        message_thread_id: Optional[int],
+        direct_messages_topic_id: Optional[int],
+        business_connection_id: Optional[str]
+    ) -> tuple:
+        # Fills in what the reply_* shortcuts take from this message when not given explicitly
+        if quote is None:
+            quote = self.chat.type is not _PRIVATE_CHAT
+
+        if reply_parameters is None and quote:
+            reply_parameters = ReplyParameters(
+                message_id=self.id
+            )
+
+        if message_thread_id is None:
+            message_thread_id = self.message_thread_id
+
+        if direct_messages_topic_id is None:
+            direct_messages_topic_id = self.direct_messages_topic_id
+
+        if business_connection_id is None:
+            business_connection_id = self.business_connection_id
+
+        return reply_parameters, message_thread_id, direct_messages_topic_id, business_connection_id
+
     async def reply_text(
         self,
         text: str,
@@ -1985,22 +1836,13 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_parameters is None and quote:
-            reply_parameters = types.ReplyParameters(
-                message_id=self.id
-            )
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if direct_messages_topic_id is None:
-            direct_messages_topic_id = self.direct_messages_topic_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_parameters, message_thread_id, direct_messages_topic_id, business_connection_id = self._resolve_reply_defaults(
+            quote,
+            reply_parameters,
+            message_thread_id,
+            direct_messages_topic_id,
+            business_connection_id
+        )
 
         return await self._client.send_message(
             chat_id=self.chat.id,
@@ -2192,22 +2034,13 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_parameters is None and quote:
-            reply_parameters = types.ReplyParameters(
-                message_id=self.id
-            )
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if direct_messages_topic_id is None:
-            direct_messages_topic_id = self.direct_messages_topic_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_parameters, message_thread_id, direct_messages_topic_id, business_connection_id = self._resolve_reply_defaults(
+            quote,
+            reply_parameters,
+            message_thread_id,
+            direct_messages_topic_id,
+            business_connection_id
+        )
 
         return await self._client.send_animation(
             chat_id=self.chat.id,
@@ -2393,22 +2226,13 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_parameters is None and quote:
-            reply_parameters = types.ReplyParameters(
-                message_id=self.id
-            )
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if direct_messages_topic_id is None:
-            direct_messages_topic_id = self.direct_messages_topic_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_parameters, message_thread_id, direct_messages_topic_id, business_connection_id = self._resolve_reply_defaults(
+            quote,
+            reply_parameters,
+            message_thread_id,
+            direct_messages_topic_id,
+            business_connection_id
+        )
 
         return await self._client.send_audio(
             chat_id=self.chat.id,
@@ -2540,22 +2364,13 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_parameters is None and quote:
-            reply_parameters = types.ReplyParameters(
-                message_id=self.id
-            )
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if direct_messages_topic_id is None:
-            direct_messages_topic_id = self.direct_messages_topic_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_parameters, message_thread_id, direct_messages_topic_id, business_connection_id = self._resolve_reply_defaults(
+            quote,
+            reply_parameters,
+            message_thread_id,
+            direct_messages_topic_id,
+            business_connection_id
+        )
 
         return await self._client.send_cached_media(
             chat_id=self.chat.id,
@@ -2729,22 +2544,13 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_parameters is None and quote:
-            reply_parameters = types.ReplyParameters(
-                message_id=self.id
-            )
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if direct_messages_topic_id is None:
-            direct_messages_topic_id = self.direct_messages_topic_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_parameters, message_thread_id, direct_messages_topic_id, business_connection_id = self._resolve_reply_defaults(
+            quote,
+            reply_parameters,
+            message_thread_id,
+            direct_messages_topic_id,
+            business_connection_id
+        )
 
         return await self._client.send_contact(
             chat_id=self.chat.id,
@@ -2929,22 +2735,13 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_parameters is None and quote:
-            reply_parameters = types.ReplyParameters(
-                message_id=self.id
-            )
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if direct_messages_topic_id is None:
-            direct_messages_topic_id = self.direct_messages_topic_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_parameters, message_thread_id, direct_messages_topic_id, business_connection_id = self._resolve_reply_defaults(
+            quote,
+            reply_parameters,
+            message_thread_id,
+            direct_messages_topic_id,
+            business_connection_id
+        )
 
         return await self._client.send_document(
             chat_id=self.chat.id,
@@ -3049,16 +2846,13 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_parameters is None and quote:
-            reply_parameters = types.ReplyParameters(
-                message_id=self.id
-            )
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
+        reply_parameters, message_thread_id, _, _ = self._resolve_reply_defaults(
+            quote,
+            reply_parameters,
+            message_thread_id,
+            None,
+            None
+        )
 
         return await self._client.send_game(
             chat_id=self.chat.id,
@@ -3142,19 +2936,13 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_parameters is None and quote:
-            reply_parameters = types.ReplyParameters(
-                message_id=self.id
-            )
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if direct_messages_topic_id is None:
-            direct_messages_topic_id = self.direct_messages_topic_id
+        reply_parameters, message_thread_id, direct_messages_topic_id, _ = self._resolve_reply_defaults(
+            quote,
+            reply_parameters,
+            message_thread_id,
+            direct_messages_topic_id,
+            None
+        )
 
         return await self._client.send_inline_bot_result(
             chat_id=self.chat.id,
@@ -3266,22 +3054,13 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_parameters is None and quote:
-            reply_parameters = types.ReplyParameters(
-                message_id=self.id
-            )
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if direct_messages_topic_id is None:
-            direct_messages_topic_id = self.direct_messages_topic_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_parameters, message_thread_id, direct_messages_topic_id, business_connection_id = self._resolve_reply_defaults(
+            quote,
+            reply_parameters,
+            message_thread_id,
+            direct_messages_topic_id,
+            business_connection_id
+        )
 
         return await self._client.send_location(
             chat_id=self.chat.id,
@@ -3385,22 +3164,13 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_parameters is None and quote:
-            reply_parameters = types.ReplyParameters(
-                message_id=self.id
-            )
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if direct_messages_topic_id is None:
-            direct_messages_topic_id = self.direct_messages_topic_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_parameters, message_thread_id, direct_messages_topic_id, business_connection_id = self._resolve_reply_defaults(
+            quote,
+            reply_parameters,
+            message_thread_id,
+            direct_messages_topic_id,
+            business_connection_id
+        )
 
         return await self._client.send_media_group(
             chat_id=self.chat.id,
@@ -3578,22 +3348,13 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_parameters is None and quote:
-            reply_parameters = types.ReplyParameters(
-                message_id=self.id
-            )
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if direct_messages_topic_id is None:
-            direct_messages_topic_id = self.direct_messages_topic_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_parameters, message_thread_id, direct_messages_topic_id, business_connection_id = self._resolve_reply_defaults(
+            quote,
+            reply_parameters,
+            message_thread_id,
+            direct_messages_topic_id,
+            business_connection_id
+        )
 
         return await self._client.send_photo(
             chat_id=self.chat.id,
@@ -3788,19 +3549,13 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_parameters is None and quote:
-            reply_parameters = types.ReplyParameters(
-                message_id=self.id
-            )
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_parameters, message_thread_id, _, business_connection_id = self._resolve_reply_defaults(
+            quote,
+            reply_parameters,
+            message_thread_id,
+            None,
+            business_connection_id
+        )
 
         return await self._client.send_poll(
             chat_id=self.chat.id,
@@ -3976,22 +3731,13 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_parameters is None and quote:
-            reply_parameters = types.ReplyParameters(
-                message_id=self.id
-            )
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if direct_messages_topic_id is None:
-            direct_messages_topic_id = self.direct_messages_topic_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_parameters, message_thread_id, direct_messages_topic_id, business_connection_id = self._resolve_reply_defaults(
+            quote,
+            reply_parameters,
+            message_thread_id,
+            direct_messages_topic_id,
+            business_connection_id
+        )
 
         return await self._client.send_sticker(
             chat_id=self.chat.id,
@@ -4132,22 +3878,13 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_parameters is None and quote:
-            reply_parameters = types.ReplyParameters(
-                message_id=self.id
-            )
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if direct_messages_topic_id is None:
-            direct_messages_topic_id = self.direct_messages_topic_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_parameters, message_thread_id, direct_messages_topic_id, business_connection_id = self._resolve_reply_defaults(
+            quote,
+            reply_parameters,
+            message_thread_id,
+            direct_messages_topic_id,
+            business_connection_id
+        )
 
         return await self._client.send_venue(
             chat_id=self.chat.id,
@@ -4367,22 +4104,13 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_parameters is None and quote:
-            reply_parameters = types.ReplyParameters(
-                message_id=self.id
-            )
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if direct_messages_topic_id is None:
-            direct_messages_topic_id = self.direct_messages_topic_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_parameters, message_thread_id, direct_messages_topic_id, business_connection_id = self._resolve_reply_defaults(
+            quote,
+            reply_parameters,
+            message_thread_id,
+            direct_messages_topic_id,
+            business_connection_id
+        )
 
         return await self._client.send_video(
             chat_id=self.chat.id,
@@ -4567,22 +4295,13 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_parameters is None and quote:
-            reply_parameters = types.ReplyParameters(
-                message_id=self.id
-            )
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if direct_messages_topic_id is None:
-            direct_messages_topic_id = self.direct_messages_topic_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_parameters, message_thread_id, direct_messages_topic_id, business_connection_id = self._resolve_reply_defaults(
+            quote,
+            reply_parameters,
+            message_thread_id,
+            direct_messages_topic_id,
+            business_connection_id
+        )
 
         return await self._client.send_video_note(
             chat_id=self.chat.id,
@@ -4755,22 +4474,13 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_parameters is None and quote:
-            reply_parameters = types.ReplyParameters(
-                message_id=self.id
-            )
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if direct_messages_topic_id is None:
-            direct_messages_topic_id = self.direct_messages_topic_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_parameters, message_thread_id, direct_messages_topic_id, business_connection_id = self._resolve_reply_defaults(
+            quote,
+            reply_parameters,
+            message_thread_id,
+            direct_messages_topic_id,
+            business_connection_id
+        )
 
         return await self._client.send_voice(
             chat_id=self.chat.id,
@@ -4923,22 +4633,13 @@ class Message(Object, Update):
         Returns:
             :obj:`~pyrogram.types.Message`: On success, the sent message is returned.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_parameters is None and quote:
-            reply_parameters = types.ReplyParameters(
-                message_id=self.id
-            )
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if direct_messages_topic_id is None:
-            direct_messages_topic_id = self.direct_messages_topic_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_parameters, message_thread_id, direct_messages_topic_id, business_connection_id = self._resolve_reply_defaults(
+            quote,
+            reply_parameters,
+            message_thread_id,
+            direct_messages_topic_id,
+            business_connection_id
+        )
 
         return await self._client.send_web_page(
             chat_id=self.chat.id,
@@ -5058,19 +4759,13 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_parameters is None and quote:
-            reply_parameters = types.ReplyParameters(
-                message_id=self.id
-            )
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_parameters, message_thread_id, _, business_connection_id = self._resolve_reply_defaults(
+            quote,
+            reply_parameters,
+            message_thread_id,
+            None,
+            business_connection_id
+        )
 
         return await self._client.send_checklist(
             chat_id=self.chat.id,
@@ -5564,26 +5259,6 @@ class Message(Object, Update):
                 reply_markup=self.reply_markup if reply_markup is object else reply_markup
             )
         elif self.media:
-            send_media = partial(
-                self._client.send_cached_media,
-                chat_id=chat_id,
-                disable_notification=disable_notification,
-                message_thread_id=message_thread_id,
-                reply_parameters=reply_parameters,
-                reply_to_message_id=reply_to_message_id,
-                reply_to_chat_id=reply_to_chat_id,
-                quote_text=quote_text,
-                quote_entities=quote_entities,
-                schedule_date=schedule_date,
-                protect_content=protect_content,
-                has_spoiler=self.has_media_spoiler if has_spoiler is None else has_spoiler,
-                show_caption_above_media=self.show_caption_above_media if show_caption_above_media is None else show_caption_above_media,
-                business_connection_id=business_connection_id,
-                allow_paid_broadcast=allow_paid_broadcast,
-                paid_message_star_count=paid_message_star_count,
-                reply_markup=self.reply_markup if reply_markup is object else reply_markup
-            )
-
             if self.photo:
                 file_id = self.photo.file_id
             elif self.audio:
@@ -5670,22 +5345,33 @@ class Message(Object, Update):
                 raise ValueError("Unknown media type")
 
             if self.sticker or self.video_note:  # Sticker and VideoNote should have no caption
-                return await send_media(
-                    file_id=file_id,
-                    message_thread_id=message_thread_id
-                )
-            else:
-                if caption is None:
-                    caption = self.caption or ""
-                    caption_entities = self.caption_entities
-
-                return await send_media(
-                    file_id=file_id,
-                    caption=caption,
-                    parse_mode=parse_mode,
-                    caption_entities=caption_entities,
-                    message_thread_id=message_thread_id
-                )
+                caption, parse_mode, caption_entities = "", None, None
+            elif caption is None:
+                caption = self.caption or ""
+                caption_entities = self.caption_entities
+
+            return await self._client.send_cached_media(
+                chat_id,
+                file_id=file_id,
+                caption=caption,
+                parse_mode=parse_mode,
+                caption_entities=caption_entities,
+                disable_notification=disable_notification,
+                message_thread_id=message_thread_id,
+                reply_parameters=reply_parameters,
+                reply_to_message_id=reply_to_message_id,
+                reply_to_chat_id=reply_to_chat_id,
+                quote_text=quote_text,
+                quote_entities=quote_entities,
+                schedule_date=schedule_date,
+                protect_content=protect_content,
+                has_spoiler=self.has_media_spoiler if has_spoiler is None else has_spoiler,
+                show_caption_above_media=self.show_caption_above_media if show_caption_above_media is None else show_caption_above_media,
+                business_connection_id=business_connection_id,
+                allow_paid_broadcast=allow_paid_broadcast,
+                paid_message_star_count=paid_message_star_count,
+                reply_markup=self.reply_markup if reply_markup is object else reply_markup
+            )
         else:
             raise ValueError("Can't copy this message")
 
@@ -6361,3 +6047,1150 @@ class Message(Object, Update):
             payment_form_id=form.id,
             input_invoice=invoice
         )
+
+
+def _apply_forum_topic(parsed_message: "Message", reply_to: "raw.types.MessageReplyHeader") -> None:
+    if not reply_to.forum_topic:
+        return
+
+    parsed_message.topic_message = True
+
+    if reply_to.reply_to_top_id:
+        parsed_message.message_thread_id = reply_to.reply_to_top_id
+    elif reply_to.reply_to_msg_id:
+        parsed_message.message_thread_id = reply_to.reply_to_msg_id
+    else:
+        parsed_message.message_thread_id = 1
+
+
+async def _resolve_user(client: "pyrogram.Client", user_id: int) -> Optional["raw.base.InputPeer"]:
+    try:
+        return await client.resolve_peer(user_id)
+    except (KeyError, BadRequest):
+        return None
+
+
+async def _fetch_users(client: "pyrogram.Client", user_ids: set, users: dict) -> None:
+    # Ids are resolved one by one so that a single unknown user doesn't drop the whole batch
+    peers = await asyncio.gather(*(_resolve_user(client, user_id) for user_id in user_ids))
+    peers = [peer for peer in peers if peer is not None]
+
+    if not peers:
+        return
+
+    try:
+        r = await client.invoke(raw.functions.users.GetUsers(id=peers))
+    except BadRequest:
+        pass
+    else:
+        users.update({i.id: i for i in r})
+
+
+# Users a service action refers to besides its sender and chat
+_SERVICE_USER_IDS = {
+    raw.types.MessageActionChatAddUser: lambda action: action.users,
+    raw.types.MessageActionChatDeleteUser: lambda action: (action.user_id,),
+    raw.types.MessageActionInviteToGroupCall: lambda action: action.users,
+}
+
+
+async def _parse_bot_allowed(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    action = message.action
+
+    if getattr(action, "domain", None):
+        return {
+            "service": enums.MessageServiceType.CONNECTED_WEBSITE,
+            "connected_website": action.domain
+        }
+
+    return {
+        "service": enums.MessageServiceType.WRITE_ACCESS_ALLOWED,
+        "write_access_allowed": types.WriteAccessAllowed._parse(action)
+    }
+
+
+async def _parse_boost_apply(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.CHAT_BOOST,
+        "chat_boost": message.action.boosts
+    }
+
+
+async def _parse_channel_create(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    if chat.type == enums.ChatType.SUPERGROUP:
+        return {
+            "service": enums.MessageServiceType.SUPERGROUP_CHAT_CREATED,
+            "supergroup_chat_created": True
+        }
+
+    return {
+        "service": enums.MessageServiceType.CHANNEL_CHAT_CREATED,
+        "channel_chat_created": True
+    }
+
+
+async def _parse_channel_migrate_from(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.MIGRATE_FROM_CHAT_ID,
+        "migrate_from_chat_id": -message.action.chat_id
+    }
+
+
+async def _parse_chat_add_user(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.NEW_CHAT_MEMBERS,
+        "new_chat_members": [types.User._parse(client, users[i]) for i in message.action.users if i in users],
+        "chat_join_type": enums.ChatJoinType.BY_ADD
+    }
+
+
+async def _parse_chat_create(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.GROUP_CHAT_CREATED,
+        "group_chat_created": True
+    }
+
+
+async def _parse_chat_delete_photo(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.DELETE_CHAT_PHOTO,
+        "delete_chat_photo": True
+    }
+
+
+async def _parse_chat_delete_user(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.LEFT_CHAT_MEMBER,
+        "left_chat_member": types.User._parse(client, users.get(message.action.user_id))
+    }
+
+
+async def _parse_chat_edit_photo(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.NEW_CHAT_PHOTO,
+        "new_chat_photo": types.Photo._parse(client, message.action.photo)
+    }
+
+
+async def _parse_chat_edit_title(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.NEW_CHAT_TITLE,
+        "new_chat_title": message.action.title
+    }
+
+
+async def _parse_chat_joined_by_link(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    new_chat_member = types.User._parse(client, users.get(utils.get_raw_peer_id(message.from_id)))
+
+    return {
+        "service": enums.MessageServiceType.NEW_CHAT_MEMBERS,
+        "new_chat_members": [new_chat_member] if new_chat_member else [],
+        "chat_join_type": enums.ChatJoinType.BY_LINK
+    }
+
+
+async def _parse_chat_joined_by_request(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    new_chat_member = types.User._parse(client, users.get(utils.get_raw_peer_id(message.from_id)))
+
+    return {
+        "service": enums.MessageServiceType.NEW_CHAT_MEMBERS,
+        "new_chat_members": [new_chat_member] if new_chat_member else [],
+        "chat_join_type": enums.ChatJoinType.BY_REQUEST
+    }
+
+
+async def _parse_chat_migrate_to(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.MIGRATE_TO_CHAT_ID,
+        "migrate_to_chat_id": utils.get_channel_id(message.action.channel_id)
+    }
+
+
+async def _parse_contact_sign_up(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.CONTACT_REGISTERED,
+        "contact_registered": types.ContactRegistered()
+    }
+
+
+async def _parse_custom_action(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.CUSTOM_ACTION,
+        "text": message.action.message
+    }
+
+
+async def _parse_geo_proximity_reached(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.PROXIMITY_ALERT_TRIGGERED,
+        "proximity_alert_triggered": types.ProximityAlertTriggered._parse(client, message.action, users, chats)
+    }
+
+
+async def _parse_gift_code(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.GIFT_CODE,
+        "gift_code": types.GiftCode._parse(client, message.action, users, chats)
+    }
+
+
+def _parse_gift_parties(message: "raw.types.MessageService", users: dict) -> tuple:
+    from_id = utils.get_raw_peer_id(message.from_id)
+    peer_id = utils.get_raw_peer_id(message.peer_id)
+    gifter = users.get(from_id)
+
+    return gifter, users.get(peer_id) if peer_id else gifter
+
+
+async def _parse_gift_premium(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    gifter, receiver = _parse_gift_parties(message, users)
+
+    return {
+        "service": enums.MessageServiceType.GIFTED_PREMIUM,
+        "gifted_premium": await types.GiftedPremium._parse(
+            client,
+            message.action,
+            gifter=gifter,
+            receiver=receiver,
+            users=users
+        )
+    }
+
+
+async def _parse_gift_stars(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    gifter, receiver = _parse_gift_parties(message, users)
+
+    return {
+        "service": enums.MessageServiceType.GIFTED_STARS,
+        "gifted_stars": await types.GiftedStars._parse(
+            client,
+            message.action,
+            gifter=gifter,
+            receiver=receiver
+        )
+    }
+
+
+async def _parse_gift_ton(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    gifter, receiver = _parse_gift_parties(message, users)
+
+    return {
+        "service": enums.MessageServiceType.GIFTED_TON,
+        "gifted_ton": await types.GiftedTon._parse(
+            client,
+            message.action,
+            gifter=gifter,
+            receiver=receiver
+        )
+    }
+
+
+async def _parse_giveaway_launch(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.GIVEAWAY_CREATED,
+        "giveaway_created": types.GiveawayCreated._parse(client, message.action)
+    }
+
+
+async def _parse_giveaway_results(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.GIVEAWAY_COMPLETED,
+        "giveaway_completed": await types.GiveawayCompleted._parse(
+            client,
+            message.action,
+            chat,
+            getattr(message.reply_to, "reply_to_msg_id", None)
+        )
+    }
+
+
+async def _parse_group_call(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    action = message.action
+
+    if action.duration:
+        return {
+            "service": enums.MessageServiceType.VIDEO_CHAT_ENDED,
+            "video_chat_ended": types.VideoChatEnded._parse(action)
+        }
+
+    return {
+        "service": enums.MessageServiceType.VIDEO_CHAT_STARTED,
+        "video_chat_started": types.VideoChatStarted()
+    }
+
+
+async def _parse_group_call_scheduled(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.VIDEO_CHAT_SCHEDULED,
+        "video_chat_scheduled": types.VideoChatScheduled._parse(message.action)
+    }
+
+
+async def _parse_history_clear(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.HISTORY_CLEARED,
+        "history_cleared": types.HistoryCleared()
+    }
+
+
+async def _parse_invite_to_group_call(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.VIDEO_CHAT_MEMBERS_INVITED,
+        "video_chat_members_invited": types.VideoChatMembersInvited._parse(client, message.action, users)
+    }
+
+
+async def _parse_payment_sent(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.SUCCESSFUL_PAYMENT,
+        "successful_payment": types.SuccessfulPayment._parse(message.action)
+    }
+
+
+async def _parse_payment_refunded(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.REFUNDED_PAYMENT,
+        "refunded_payment": types.RefundedPayment._parse(message.action)
+    }
+
+
+async def _parse_suggested_post_approval(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    action = message.action
+
+    if action.balance_too_low:
+        return {
+            "service": enums.MessageServiceType.SUGGESTED_POST_APPROVAL_FAILED,
+            "suggested_post_approval_failed": await types.SuggestedPostApprovalFailed._parse(client, message)
+        }
+
+    if action.rejected:
+        return {
+            "service": enums.MessageServiceType.SUGGESTED_POST_DECLINED,
+            "suggested_post_declined": await types.SuggestedPostDeclined._parse(client, message)
+        }
+
+    return {
+        "service": enums.MessageServiceType.SUGGESTED_POST_APPROVED,
+        "suggested_post_approved": await types.SuggestedPostApproved._parse(client, message)
+    }
+
+
+async def _parse_suggested_post_success(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.SUGGESTED_POST_PAID,
+        "suggested_post_paid": await types.SuggestedPostPaid._parse(client, message)
+    }
+
+
+async def _parse_suggested_post_refund(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.SUGGESTED_POST_REFUNDED,
+        "suggested_post_refunded": await types.SuggestedPostRefunded._parse(client, message)
+    }
+
+
+async def _parse_phone_call(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    action = message.action
+
+    if action.reason:
+        return {
+            "service": enums.MessageServiceType.PHONE_CALL_ENDED,
+            "phone_call_ended": types.PhoneCallEnded._parse(action)
+        }
+
+    return {
+        "service": enums.MessageServiceType.PHONE_CALL_STARTED,
+        "phone_call_started": types.PhoneCallStarted._parse(action)
+    }
+
+
+async def _parse_prize_stars(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.GIVEAWAY_PRIZE_STARS,
+        "giveaway_prize_stars": await types.GiveawayPrizeStars._parse(client, message.action, chats)
+    }
+
+
+async def _parse_requested_peer(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    action = message.action
+    requested_chat = types.ChatShared._parse(client, action, chats)
+
+    if requested_chat is None:
+        return {
+            "service": enums.MessageServiceType.USERS_SHARED,
+            "users_shared": types.UsersShared._parse(client, action, users)
+        }
+
+    return {
+        "service": enums.MessageServiceType.CHAT_SHARED,
+        "chat_shared": requested_chat
+    }
+
+
+async def _parse_screenshot_taken(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.SCREENSHOT_TAKEN,
+        "screenshot_taken": types.ScreenshotTaken()
+    }
+
+
+async def _parse_set_chat_theme(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.CHAT_SET_THEME,
+        "chat_set_theme": await types.ChatTheme._parse(client, message.action.theme)
+    }
+
+
+async def _parse_set_chat_wallpaper(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    action = message.action
+
+    return {
+        "service": enums.MessageServiceType.CHAT_SET_BACKGROUND,
+        "chat_set_background": types.ChatBackground._parse(client, action.wallpaper, action.same, action.for_both)
+    }
+
+
+async def _parse_set_messages_ttl(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.SET_MESSAGE_AUTO_DELETE_TIME,
+        "set_message_auto_delete_time": message.action.period
+    }
+
+
+async def _parse_star_gift(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.GIFT,
+        "is_prepaid_upgrade": message.action.prepaid_upgrade,
+        "gift": await types.Gift._parse_action(client, message, users, chats)
+    }
+
+
+async def _parse_suggest_profile_photo(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.SUGGEST_PROFILE_PHOTO,
+        "suggest_profile_photo": types.Photo._parse(client, message.action.photo)
+    }
+
+
+async def _parse_suggest_birthday(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.SUGGEST_BIRTHDAY,
+        "suggest_birthday": types.Birthday._parse(message.action.birthday)
+    }
+
+
+async def _parse_topic_create(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.FORUM_TOPIC_CREATED,
+        "forum_topic_created": types.ForumTopicCreated._parse(message)
+    }
+
+
+async def _parse_topic_edit(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    action = message.action
+
+    if action.hidden is True:
+        return {
+            "service": enums.MessageServiceType.GENERAL_FORUM_TOPIC_HIDDEN,
+            "general_forum_topic_hidden": types.GeneralForumTopicHidden()
+        }
+
+    if action.hidden is False:
+        return {
+            "service": enums.MessageServiceType.GENERAL_FORUM_TOPIC_UNHIDDEN,
+            "general_forum_topic_unhidden": types.GeneralForumTopicUnhidden()
+        }
+
+    if action.closed is True:
+        return {
+            "service": enums.MessageServiceType.FORUM_TOPIC_CLOSED,
+            "forum_topic_closed": types.ForumTopicClosed()
+        }
+
+    if action.closed is False:
+        return {
+            "service": enums.MessageServiceType.FORUM_TOPIC_REOPENED,
+            "forum_topic_reopened": types.ForumTopicReopened()
+        }
+
+    return {
+        "service": enums.MessageServiceType.FORUM_TOPIC_EDITED,
+        "forum_topic_edited": types.ForumTopicEdited._parse(action)
+    }
+
+
+async def _parse_web_view_data_sent(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.WEB_APP_DATA,
+        "web_app_data": types.WebAppData._parse(message.action)
+    }
+
+
+async def _parse_paid_messages_refunded(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.PAID_MESSAGES_REFUNDED,
+        "paid_messages_refunded": types.PaidMessagesRefunded._parse(message.action)
+    }
+
+
+async def _parse_paid_messages_price(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    if chat.type == enums.ChatType.DIRECT:
+        return {
+            "service": enums.MessageServiceType.DIRECT_MESSAGE_PRICE_CHANGED,
+            "direct_message_price_changed": types.DirectMessagePriceChanged._parse(message.action)
+        }
+
+    return {
+        "service": enums.MessageServiceType.PAID_MESSAGES_PRICE_CHANGED,
+        "paid_messages_price_changed": types.PaidMessagesPriceChanged._parse(message.action)
+    }
+
+
+async def _parse_todo_completions(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.CHECKLIST_TASKS_DONE,
+        "checklist_tasks_done": types.ChecklistTasksDone._parse(message)
+    }
+
+
+async def _parse_todo_append_tasks(
+    client: "pyrogram.Client",
+    message: "raw.types.MessageService",
+    users: dict,
+    chats: dict,
+    chat: "types.Chat"
+) -> dict:
+    return {
+        "service": enums.MessageServiceType.CHECKLIST_TASKS_ADDED,
+        "checklist_tasks_added": types.ChecklistTasksAdded._parse(client, message)
+    }
+
+
+# TODO: raw.types.MessageActionEmpty
+# TODO: raw.types.MessageActionSecureValuesSent (PASSPORT_DATA_SEND)
+# TODO: raw.types.MessageActionSecureValuesSentMe (PASSPORT_DATA_RECEIVED)
+_SERVICE_PARSERS = {
+    raw.types.MessageActionBotAllowed: _parse_bot_allowed,
+    raw.types.MessageActionBoostApply: _parse_boost_apply,
+    raw.types.MessageActionChannelCreate: _parse_channel_create,
+    raw.types.MessageActionChannelMigrateFrom: _parse_channel_migrate_from,
+    raw.types.MessageActionChatAddUser: _parse_chat_add_user,
+    raw.types.MessageActionChatCreate: _parse_chat_create,
+    raw.types.MessageActionChatDeletePhoto: _parse_chat_delete_photo,
+    raw.types.MessageActionChatDeleteUser: _parse_chat_delete_user,
+    raw.types.MessageActionChatEditPhoto: _parse_chat_edit_photo,
+    raw.types.MessageActionChatEditTitle: _parse_chat_edit_title,
+    raw.types.MessageActionChatJoinedByLink: _parse_chat_joined_by_link,
+    raw.types.MessageActionChatJoinedByRequest: _parse_chat_joined_by_request,
+    raw.types.MessageActionChatMigrateTo: _parse_chat_migrate_to,
+    raw.types.MessageActionContactSignUp: _parse_contact_sign_up,
+    raw.types.MessageActionCustomAction: _parse_custom_action,
+    raw.types.MessageActionGeoProximityReached: _parse_geo_proximity_reached,
+    raw.types.MessageActionGiftCode: _parse_gift_code,
+    raw.types.MessageActionGiftPremium: _parse_gift_premium,
+    raw.types.MessageActionGiftStars: _parse_gift_stars,
+    raw.types.MessageActionGiftTon: _parse_gift_ton,
+    raw.types.MessageActionGiveawayLaunch: _parse_giveaway_launch,
+    raw.types.MessageActionGiveawayResults: _parse_giveaway_results,
+    raw.types.MessageActionGroupCall: _parse_group_call,
+    raw.types.MessageActionGroupCallScheduled: _parse_group_call_scheduled,
+    raw.types.MessageActionHistoryClear: _parse_history_clear,
+    raw.types.MessageActionInviteToGroupCall: _parse_invite_to_group_call,
+    raw.types.MessageActionPaymentSent: _parse_payment_sent,
+    raw.types.MessageActionPaymentSentMe: _parse_payment_sent,
+    raw.types.MessageActionPaymentRefunded: _parse_payment_refunded,
+    raw.types.MessageActionSuggestedPostApproval: _parse_suggested_post_approval,
+    raw.types.MessageActionSuggestedPostSuccess: _parse_suggested_post_success,
+    raw.types.MessageActionSuggestedPostRefund: _parse_suggested_post_refund,
+    raw.types.MessageActionPhoneCall: _parse_phone_call,
+    raw.types.MessageActionPrizeStars: _parse_prize_stars,
+    raw.types.MessageActionRequestedPeer: _parse_requested_peer,
+    raw.types.MessageActionRequestedPeerSentMe: _parse_requested_peer,
+    raw.types.MessageActionScreenshotTaken: _parse_screenshot_taken,
+    raw.types.MessageActionSetChatTheme: _parse_set_chat_theme,
+    raw.types.MessageActionSetChatWallPaper: _parse_set_chat_wallpaper,
+    raw.types.MessageActionSetMessagesTTL: _parse_set_messages_ttl,
+    raw.types.MessageActionStarGift: _parse_star_gift,
+    raw.types.MessageActionStarGiftUnique: _parse_star_gift,
+    raw.types.MessageActionSuggestProfilePhoto: _parse_suggest_profile_photo,
+    raw.types.MessageActionSuggestBirthday: _parse_suggest_birthday,
+    raw.types.MessageActionTopicCreate: _parse_topic_create,
+    raw.types.MessageActionTopicEdit: _parse_topic_edit,
+    raw.types.MessageActionWebViewDataSent: _parse_web_view_data_sent,
+    raw.types.MessageActionWebViewDataSentMe: _parse_web_view_data_sent,
+    raw.types.MessageActionPaidMessagesRefunded: _parse_paid_messages_refunded,
+    raw.types.MessageActionPaidMessagesPrice: _parse_paid_messages_price,
+    raw.types.MessageActionTodoCompletions: _parse_todo_completions,
+    raw.types.MessageActionTodoAppendTasks: _parse_todo_append_tasks,
+}
+
+
+_REPLY_MARKUP_READERS = {
+    raw.types.ReplyKeyboardForceReply: lambda markup: types.ForceReply.read(markup),
+    raw.types.ReplyKeyboardMarkup: lambda markup: types.ReplyKeyboardMarkup.read(markup),
+    raw.types.ReplyInlineMarkup: lambda markup: types.InlineKeyboardMarkup.read(markup),
+    raw.types.ReplyKeyboardHide: lambda markup: types.ReplyKeyboardRemove.read(markup),
+}
+
+
+async def _parse_media_photo(
+    client: "pyrogram.Client",
+    media: "raw.types.MessageMediaPhoto",
+    users: dict,
+    chats: dict
+) -> dict:
+    return {
+        "media": enums.MessageMediaType.PHOTO,
+        "photo": types.Photo._parse(client, media.photo, media.ttl_seconds),
+        "has_media_spoiler": media.spoiler
+    }
+
+
+async def _parse_media_geo(
+    client: "pyrogram.Client",
+    media: "raw.types.MessageMediaGeo",
+    users: dict,
+    chats: dict
+) -> dict:
+    return {
+        "media": enums.MessageMediaType.LOCATION,
+        "location": types.Location._parse(media.geo)
+    }
+
+
+async def _parse_media_geo_live(
+    client: "pyrogram.Client",
+    media: "raw.types.MessageMediaGeoLive",
+    users: dict,
+    chats: dict
+) -> dict:
+    return {
+        "media": enums.MessageMediaType.LOCATION,
+        "location": types.Location._parse_media(media)
+    }
+
+
+async def _parse_media_contact(
+    client: "pyrogram.Client",
+    media: "raw.types.MessageMediaContact",
+    users: dict,
+    chats: dict
+) -> dict:
+    return {
+        "media": enums.MessageMediaType.CONTACT,
+        "contact": types.Contact._parse(client, media)
+    }
+
+
+async def _parse_media_venue(
+    client: "pyrogram.Client",
+    media: "raw.types.MessageMediaVenue",
+    users: dict,
+    chats: dict
+) -> dict:
+    return {
+        "media": enums.MessageMediaType.VENUE,
+        "venue": types.Venue._parse(client, media)
+    }
+
+
+async def _parse_media_game(
+    client: "pyrogram.Client",
+    media: "raw.types.MessageMediaGame",
+    users: dict,
+    chats: dict
+) -> dict:
+    return {
+        "media": enums.MessageMediaType.GAME,
+        "game": types.Game._parse(client, media)
+    }
+
+
+async def _parse_media_giveaway(
+    client: "pyrogram.Client",
+    media: "raw.types.MessageMediaGiveaway",
+    users: dict,
+    chats: dict
+) -> dict:
+    return {
+        "media": enums.MessageMediaType.GIVEAWAY,
+        "giveaway": types.Giveaway._parse(client, media, chats)
+    }
+
+
+async def _parse_media_giveaway_results(
+    client: "pyrogram.Client",
+    media: "raw.types.MessageMediaGiveawayResults",
+    users: dict,
+    chats: dict
+) -> dict:
+    return {
+        "media": enums.MessageMediaType.GIVEAWAY_WINNERS,
+        "giveaway_winners": await types.GiveawayWinners._parse(client, media, users, chats)
+    }
+
+
+async def _parse_media_invoice(
+    client: "pyrogram.Client",
+    media: "raw.types.MessageMediaInvoice",
+    users: dict,
+    chats: dict
+) -> dict:
+    return {
+        "media": enums.MessageMediaType.INVOICE,
+        "invoice": types.Invoice._parse(client, media)
+    }
+
+
+async def _parse_media_story(
+    client: "pyrogram.Client",
+    media: "raw.types.MessageMediaStory",
+    users: dict,
+    chats: dict
+) -> dict:
+    return {
+        "media": enums.MessageMediaType.STORY,
+        "story": await types.Story._parse(client, media, media.peer, users, chats)
+    }
+
+
+async def _parse_media_document(
+    client: "pyrogram.Client",
+    media: "raw.types.MessageMediaDocument",
+    users: dict,
+    chats: dict
+) -> dict:
+    doc = media.document
+
+    if not isinstance(doc, raw.types.Document):
+        return {"has_media_spoiler": media.spoiler}
+
+    file_name = None
+    video_attributes = None
+    audio_attributes = None
+    is_animated = False
+    is_sticker = False
+
+    for attribute in doc.attributes:
+        attribute_type = type(attribute)
+
+        if attribute_type is raw.types.DocumentAttributeFilename:
+            file_name = attribute.file_name
+        elif attribute_type is raw.types.DocumentAttributeVideo:
+            video_attributes = attribute
+        elif attribute_type is raw.types.DocumentAttributeAudio:
+            audio_attributes = attribute
+        elif attribute_type is raw.types.DocumentAttributeAnimated:
+            is_animated = True
+        elif attribute_type is raw.types.DocumentAttributeSticker:
+            is_sticker = True
+
+    if is_animated:
+        if video_attributes and video_attributes.round_message:
+            parsed_media = {
+                "media": enums.MessageMediaType.VIDEO_NOTE,
+                "video_note": types.VideoNote._parse(client, doc, video_attributes, media.ttl_seconds)
+            }
+        else:
+            parsed_media = {
+                "media": enums.MessageMediaType.ANIMATION,
+                "animation": types.Animation._parse(client, doc, video_attributes, file_name)
+            }
+    elif is_sticker:
+        parsed_media = {
+            "media": enums.MessageMediaType.STICKER,
+            "sticker": await types.Sticker._parse(client, doc)
+        }
+    elif video_attributes is not None:
+        if video_attributes.round_message:
+            parsed_media = {
+                "media": enums.MessageMediaType.VIDEO_NOTE,
+                "video_note": types.VideoNote._parse(client, doc, video_attributes, media.ttl_seconds)
+            }
+        else:
+            parsed_media = {
+                "media": enums.MessageMediaType.VIDEO,
+                "video": types.Video._parse(client, doc, video_attributes, file_name, media.ttl_seconds, media.video_cover, media.video_timestamp, media.alt_documents)
+            }
+    elif audio_attributes is not None:
+        if audio_attributes.voice:
+            parsed_media = {
+                "media": enums.MessageMediaType.VOICE,
+                "voice": types.Voice._parse(client, doc, audio_attributes, media.ttl_seconds)
+            }
+        else:
+            parsed_media = {
+                "media": enums.MessageMediaType.AUDIO,
+                "audio": types.Audio._parse(client, doc, audio_attributes, file_name)
+            }
+    else:
+        parsed_media = {
+            "media": enums.MessageMediaType.DOCUMENT,
+            "document": types.Document._parse(client, doc, file_name)
+        }
+
+    parsed_media["has_media_spoiler"] = media.spoiler
+
+    return parsed_media
+
+
+async def _parse_media_web_page(
+    client: "pyrogram.Client",
+    media: "raw.types.MessageMediaWebPage",
+    users: dict,
+    chats: dict
+) -> dict:
+    return {
+        "media": enums.MessageMediaType.WEB_PAGE,
+        "web_page": types.WebPage._parse(client, media)
+    }
+
+
+async def _parse_media_poll(
+    client: "pyrogram.Client",
+    media: "raw.types.MessageMediaPoll",
+    users: dict,
+    chats: dict
+) -> dict:
+    return {
+        "media": enums.MessageMediaType.POLL,
+        "poll": types.Poll._parse(client, media)
+    }
+
+
+async def _parse_media_dice(
+    client: "pyrogram.Client",
+    media: "raw.types.MessageMediaDice",
+    users: dict,
+    chats: dict
+) -> dict:
+    return {
+        "media": enums.MessageMediaType.DICE,
+        "dice": types.Dice._parse(client, media)
+    }
+
+
+async def _parse_media_paid_media(
+    client: "pyrogram.Client",
+    media: "raw.types.MessageMediaPaidMedia",
+    users: dict,
+    chats: dict
+) -> dict:
+    return {
+        "media": enums.MessageMediaType.PAID_MEDIA,
+        "paid_media": types.PaidMediaInfo._parse(client, media)
+    }
+
+
+async def _parse_media_todo(
+    client: "pyrogram.Client",
+    media: "raw.types.MessageMediaToDo",
+    users: dict,
+    chats: dict
+) -> dict:
+    return {
+        "media": enums.MessageMediaType.CHECKLIST,
+        "checklist": types.Checklist._parse(client, media, users)
+    }
+
+
+_MEDIA_PARSERS = {
+    raw.types.MessageMediaPhoto: _parse_media_photo,
+    raw.types.MessageMediaGeo: _parse_media_geo,
+    raw.types.MessageMediaGeoLive: _parse_media_geo_live,
+    raw.types.MessageMediaContact: _parse_media_contact,
+    raw.types.MessageMediaVenue: _parse_media_venue,
+    raw.types.MessageMediaGame: _parse_media_game,
+    raw.types.MessageMediaGiveaway: _parse_media_giveaway,
+    raw.types.MessageMediaGiveawayResults: _parse_media_giveaway_results,
+    raw.types.MessageMediaInvoice: _parse_media_invoice,
+    raw.types.MessageMediaStory: _parse_media_story,
+    raw.types.MessageMediaDocument: _parse_media_document,
+    raw.types.MessageMediaWebPage: _parse_media_web_page,
+    raw.types.MessageMediaPoll: _parse_media_poll,
+    raw.types.MessageMediaDice: _parse_media_dice,
+    raw.types.MessageMediaPaidMedia: _parse_media_paid_media,
+    raw.types.MessageMediaToDo: _parse_media_todo,
+}
@@ -104,25 +104,23 @@ class MessageEntity(Object):
         )
 
     async def write(self):
-        args = self.__dict__.copy()
-
-        for arg in ("_client", "type", "user"):
-            args.pop(arg)
+        args = {
+            "offset": self.offset,
+            "length": self.length
+        }
 
         if self.user:
             args["user_id"] = await self._client.resolve_peer(self.user.id)
 
-        if not self.url:
-            args.pop("url")
+        if self.url:
+            args["url"] = self.url
 
-        if self.language is None:
-            args.pop("language")
+        if self.language is not None:
+            args["language"] = self.language
 
-        args.pop("custom_emoji_id")
         if self.custom_emoji_id is not None:
             args["document_id"] = self.custom_emoji_id
 
-        args.pop("expandable")
         if self.expandable is not None:
             args["collapsed"] = self.expandable
 
@@ -17,7 +17,7 @@
 #  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
 
 from datetime import datetime
-from typing import Dict, List, Type
+from typing import Dict, List, Optional, Type
 
 import pyrogram
 from pyrogram import enums, raw, types, utils
@@ -173,8 +173,11 @@ class Sticker(Object):
     async def _parse(
         client: "pyrogram.Client",
         sticker: "raw.types.Document",
-        document_attributes: Dict[Type["raw.base.DocumentAttribute"], "raw.base.DocumentAttribute"],
+        document_attributes: Optional[Dict[Type["raw.base.DocumentAttribute"], "raw.base.DocumentAttribute"]] = None,
     ) -> "Sticker":
+        if document_attributes is None:
+            document_attributes = {type(i): i for i in sticker.attributes}
+
         sticker_attribute = None
         set_name = None
 
@@ -412,11 +412,8 @@ class Story(Object, Update):
             disallowed_users=disallowed_users,
             reactions=reactions,
             reactions_count=reactions_count,
-            media_areas=types.List(
-                [
-                    await types.MediaArea._parse(client, area, chats)
-                    for area in getattr(story, "media_areas", [])
-                ]
+            media_areas=await types.MediaArea._parse_many(
+                client, getattr(story, "media_areas", None) or [], chats
             ) or None,
             raw=story,
             client=client
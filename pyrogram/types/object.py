@@ -19,15 +19,36 @@
 import typing
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from json import dumps
 
 import pyrogram
 
 
+@lru_cache(maxsize=None)
+def _slot_names(cls: type) -> typing.Tuple[str, ...]:
+    """Names of the slots declared by a class and its bases, in declaration order."""
+    return tuple(
+        attr
+        for base in reversed(cls.__mro__)
+        for attr in base.__dict__.get("__slots__", ())
+        if attr not in ("__dict__", "__weakref__")
+    )
+
+
 class Object:
+    __slots__ = ("_client",)
+
     def __init__(self, client: "pyrogram.Client" = None):
         self._client = client
 
+    def _attributes(self) -> typing.List[str]:
+        """Names of the attributes set on this object, stored either in ``__dict__`` or in ``__slots__``."""
+        attributes = [attr for attr in _slot_names(type(self)) if hasattr(self, attr)]
+        attributes.extend(getattr(self, "__dict__", ()))
+
+        return attributes
+
     def bind(self, client: "pyrogram.Client"):
         """Bind a Client instance to this and to all nested Pyrogram objects.
 
@@ -38,7 +59,7 @@ class Object:
         """
         self._client = client
 
-        for i in self.__dict__:
+        for i in self._attributes():
             o = getattr(self, i)
 
             if isinstance(o, Object):
@@ -64,19 +85,18 @@ class Object:
             "raw"
         ]
 
-        filtered_attributes = {
-            attr: ("*" * 9 if attr == "phone_number" else getattr(obj, attr))
-            for attr in filter(
-                lambda x: not x.startswith("_") and x not in attributes_to_hide,
-                obj.__dict__,
-            )
-            if getattr(obj, attr) is not None
-        }
+        filtered_attributes = {"_": obj.__class__.__name__}
+
+        for attr in obj._attributes():
+            if attr.startswith("_") or attr in attributes_to_hide:
+                continue
+
+            value = getattr(obj, attr)
+
+            if value is not None:
+                filtered_attributes[attr] = "*" * 9 if attr == "phone_number" else value
 
-        return {
-            "_": obj.__class__.__name__,
-            **filtered_attributes
-        }
+        return filtered_attributes
 
     def __str__(self) -> str:
         return dumps(self, indent=4, default=Object.default, ensure_ascii=False)
@@ -86,13 +106,13 @@ class Object:
             self.__class__.__name__,
             ", ".join(
                 f"{attr}={repr(getattr(self, attr))}"
-                for attr in filter(lambda x: not x.startswith("_"), self.__dict__)
+                for attr in filter(lambda x: not x.startswith("_"), self._attributes())
                 if getattr(self, attr) is not None
             )
         )
 
     def __eq__(self, other: "Object") -> bool:
-        for attr in self.__dict__:
+        for attr in self._attributes():
             try:
                 if attr.startswith("_"):
                     continue
@@ -112,10 +132,11 @@ class Object:
             if isinstance(obj, tuple) and len(obj) == 2 and obj[0] == "dt":
                 state[attr] = datetime.fromtimestamp(obj[1])
 
-        self.__dict__ = state
+        for attr, obj in state.items():
+            setattr(self, attr, obj)
 
     def __getstate__(self):
-        state = self.__dict__.copy()
+        state = {attr: getattr(self, attr) for attr in self._attributes()}
         state.pop("_client", None)
 
         for attr in state:
@@ -61,11 +61,7 @@ class BusinessIntro(Object):
         sticker = None
 
         if doc and isinstance(doc, raw.types.Document):
-            sticker = await types.Sticker._parse(
-                client,
-                doc,
-                {type(i): i for i in doc.attributes}
-            )
+            sticker = await types.Sticker._parse(client, doc)
 
         return BusinessIntro(
             title=getattr(business_intro, "title", None),
@@ -153,17 +153,14 @@ async def parse_messages(
         if not messages.messages:
             return types.List()
 
-        for message in messages.messages:
-            parsed_messages.append(
-                await types.Message._parse(
-                    client=client,
-                    message=message,
-                    users=users,
-                    chats=chats,
-                    topics=topics,
-                    replies=0
-                )
-            )
+        parsed_messages = await types.Message._parse_many(
+            client=client,
+            messages=messages.messages,
+            users=users,
+            chats=chats,
+            topics=topics,
+            replies=0
+        )
 
         if replies:
             messages_with_replies = {}
@@ -195,14 +192,29 @@ async def parse_messages(
                         replies=replies - 1
                     )
                 else:
+                    # Fetch the replied messages of each chat with one request, all chats at once
+                    reply_ids_by_chat = {}
+
                     for reply_header in messages_with_replies.values():
-                        reply_messages.append(
-                            await client.get_messages(
-                                chat_id=get_peer_id(reply_header.reply_to_peer_id) if getattr(reply_header, "reply_to_peer_id", None) else chat_id,
-                                message_ids=reply_header.reply_to_msg_id,
+                        if not reply_header.reply_to_msg_id:
+                            continue
+
+                        reply_chat_id = get_peer_id(reply_header.reply_to_peer_id) if getattr(reply_header, "reply_to_peer_id", None) else chat_id
+                        reply_ids_by_chat.setdefault(reply_chat_id, set()).add(reply_header.reply_to_msg_id)
+
+                    for chat_reply_messages in await asyncio.gather(
+                        *[
+                            client.get_messages(
+                                chat_id=reply_chat_id,
+                                message_ids=list(reply_ids),
                                 replies=replies - 1
                             )
-                        )
+                            for reply_chat_id, reply_ids in reply_ids_by_chat.items()
+                        ]
+                    ):
+                        reply_messages.extend(chat_reply_messages)
+
+                reply_messages_by_id = {reply.id: reply for reply in reply_messages}
 
                 for message in parsed_messages:
                     reply_to = messages_with_replies.get(message.id, None)
@@ -210,9 +222,10 @@ async def parse_messages(
                     if not reply_to:
                         continue
 
-                    for reply in reply_messages:
-                        if reply.id == reply_to.reply_to_msg_id:
-                            message.reply_to_message = reply
+                    reply = reply_messages_by_id.get(reply_to.reply_to_msg_id)
+
+                    if reply is not None:
+                        message.reply_to_message = reply
     else:
         for u in getattr(messages, "updates", []):
             if isinstance(
@@ -570,6 +583,8 @@ def max_datetime() -> datetime:
     return datetime.fromtimestamp((1 << 31) - 1, timezone.utc)
 
 
+# Messages of a batch or an update burst often share their timestamps, and datetimes are immutable
+@functools.lru_cache(maxsize=2048)
 def timestamp_to_datetime(ts: Optional[int]) -> Optional[datetime]:
     return datetime.fromtimestamp(ts) if ts else None
 